@@ -0,0 +1,57 @@
+import json
+from typing import Any, Callable
+
+import ujson
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class Codec:
+    """**JSON backend of REST responses, websocket messages and request payloads**
+
+    Args:
+        name: name of the backend
+        loads: function that decodes ``bytes`` or ``str``
+        dumps: function that encodes to ``str``, compact, without spaces
+    """
+
+    def __init__(self,
+                 name: str,
+                 loads: Callable[[bytes | str], Any],
+                 dumps: Callable[[Any], str]):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"Codec({self.name!r})"
+
+
+CODECS: dict[str, Codec] = {
+    'ujson': Codec('ujson', ujson.loads, ujson.dumps),
+    'json': Codec('json', json.loads, lambda obj: json.dumps(obj, separators=(',', ':'))),
+}
+if orjson is not None:
+    CODECS['orjson'] = Codec('orjson', orjson.loads, lambda obj: orjson.dumps(obj).decode())
+
+DEFAULT_CODEC = CODECS['ujson']
+
+
+def get_codec(codec: str | Codec | None = None) -> Codec:
+    """**Codec by name**
+
+    Args:
+        codec: 'ujson', 'orjson' (needs ``pip install orjson``), 'json' or a Codec(). Default ujson
+    """
+    if codec is None:
+        return DEFAULT_CODEC
+    if isinstance(codec, Codec):
+        return codec
+    if codec == 'orjson' and orjson is None:
+        raise ImportError("The orjson codec needs orjson, please install it: pip install aio-binance-library[orjson]")
+    if codec not in CODECS:
+        raise ValueError(f"Codec must be one of {tuple(CODECS)} or a Codec()")
+    return CODECS[codec]
@@ -1,10 +1,17 @@
 from sys import stderr
-import asyncio
-import aiohttp
 from loguru import logger
 import aio_binance.futures.usdt.api.manager
 from .api import manager
-
+from .api.ban import BanGate
+from .api.cache import ResponseCache
+from .api.clock import TimeSync
+from .api.limiter import RateLimiter
+from .api import pool
+from .api.retry import RetryPolicy
+from .api.scheduler import PriorityScheduler
+
+from .websocket.book import BookSide, OrderBook, OrderBookManager
+from .websocket.multiplex import Multiplexer
 from .websocket.query import Ws
 from .websocket.streams import Streams
 
@@ -33,6 +40,19 @@ class Client(manager.FactoryApi):
             timeout: Timeout in second for reconnect
         Keyword Args:
             session: (optional) aiohttp.ClientSession()
+            connector: (optional) dict of connection pool options: limit, limit_per_host,
+                keepalive_timeout, ttl_dns_cache
+            retry: (optional) RetryPolicy() of public requests
+            ban_gate: (optional) BanGate(), by default one gate is shared by all clients
+            limiter: (optional) RateLimiter(), by default the IP weight is shared by all clients
+            scheduler: (optional) PriorityScheduler() of the requests
+            coalesce: (optional) share one response between identical public requests in flight
+            cache: (optional) True or ResponseCache() for slow-changing data like exchange info
+            time_sync: (optional) True or TimeSync() to keep signed requests in sync with the server clock
+            recv_window: (optional) recvWindow of signed requests in milliseconds. Default 60000
+            symbols: (optional) True or SymbolIndex() to quantize and check orders with the symbol filters
+            codec: (optional) JSON backend 'ujson', 'orjson', 'json' or Codec(). Default 'ujson'
+            response: (optional) 'full' dict with data, 'data' payload only or 'raw' body bytes. Default 'full'
         """
         logger.remove()
         logger.add(stderr, colorize=True,
@@ -65,6 +85,19 @@ class ApiSession(manager.FactoryApi):
             timeout: Timeout in second for reconnect
         Keyword Args:
             session: (optional) aiohttp.ClientSession()
+            connector: (optional) dict of connection pool options: limit, limit_per_host,
+                keepalive_timeout, ttl_dns_cache
+            retry: (optional) RetryPolicy() of public requests
+            ban_gate: (optional) BanGate(), by default one gate is shared by all clients
+            limiter: (optional) RateLimiter(), by default the IP weight is shared by all clients
+            scheduler: (optional) PriorityScheduler() of the requests
+            coalesce: (optional) share one response between identical public requests in flight
+            cache: (optional) True or ResponseCache() for slow-changing data like exchange info
+            time_sync: (optional) True or TimeSync() to keep signed requests in sync with the server clock
+            recv_window: (optional) recvWindow of signed requests in milliseconds. Default 60000
+            symbols: (optional) True or SymbolIndex() to quantize and check orders with the symbol filters
+            codec: (optional) JSON backend 'ujson', 'orjson', 'json' or Codec(). Default 'ujson'
+            response: (optional) 'full' dict with data, 'data' payload only or 'raw' body bytes. Default 'full'
         """
         logger.remove()
         logger.add(stderr, colorize=True,
@@ -77,14 +110,41 @@ class ApiSession(manager.FactoryApi):
                          timeout=timeout,
                          **kwargs)
 
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
-        return self
 
-    async def __aexit__(self, exc_type, exc, tb):
-        await self.session.close()
-        self.session = None
-        await asyncio.sleep(0.1)
+class AccountPool(pool.Pool):
+
+    def __init__(self,
+                 accounts: dict[str, tuple[str, str]],
+                 testnet=False,
+                 debug: str = "debug",
+                 timeout=5,
+                 **kwargs):
+        """**Clients of many accounts on one connection pool**
+            Each account keeps its own signing and order rate limits, the connection pool,
+            the IP weight limit, the scheduler and the server clock are shared.
+
+        Args:
+            accounts: dict of name: (key, secret)
+            testnet: Work testnet True or False
+            debug: Debug level 'debug', 'info', 'error', default: 'debug'
+            timeout: Timeout in second for reconnect
+        Keyword Args:
+            weight: (optional) TokenBucket() of the IP weight, by default shared by all clients
+            other keyword arguments of Client(), shared by every account
+        Examples:
+            async with AccountPool({'main': (KEY, SECRET), 'sub1': (KEY1, SECRET1)}) as pool:
+                balances = await pool.gather('get_private_balance')
+                await pool['sub1'].create_private_order('BTCUSDT', 'BUY', 'MARKET', quantity='0.001')
+        """
+        logger.remove()
+        logger.add(stderr, colorize=True,
+                   format="<green>{level}</green>:     <cyan>{message}</cyan>",
+                   level=debug.upper(),
+                   enqueue=True)
+        super().__init__(accounts,
+                         testnet=testnet,
+                         timeout=timeout,
+                         **kwargs)
 
 
 class WsClient(Ws, Streams):
@@ -0,0 +1,93 @@
+import asyncio
+import re
+import time
+from typing import Callable, Optional
+
+from loguru import logger
+
+_UNTIL = re.compile(r'until (\d+)')
+
+
+class BanGate:
+    """**Pause gate for IP bans and rate limit rejections**
+        Binance answers ``429`` (too many requests) or ``418`` (IP banned),
+        usually with the code ``-1003``, and keeps rejecting everything from
+        the IP until the ban lifts. The gate remembers that deadline and every
+        request awaits it before being sent, without blocking the event loop.
+
+        One gate is shared by all clients of the process by default, because
+        the ban applies to the IP and not to a client.
+    """
+
+    def __init__(self):
+        self.banned_until: float = 0.0
+        self.code: Optional[int] = None
+        self.reason: str = ""
+        self._hooks: list[Callable] = []
+
+    @property
+    def banned(self) -> bool:
+        return time.time() < self.banned_until
+
+    @property
+    def remaining(self) -> float:
+        """**Seconds left until the ban lifts**"""
+        return max(0.0, self.banned_until - time.time())
+
+    def on_ban(self, callback: Callable) -> None:
+        """**Register a hook called when a ban starts or is extended**
+
+        Args:
+            callback: function or coroutine function
+                with arguments ``(banned_until: float, code: int, reason: str)``
+        """
+        self._hooks.append(callback)
+
+    def ban(self, until: float, code: int, reason: str = "") -> None:
+        """**Close the gate until the timestamp in seconds**"""
+        if until <= self.banned_until:
+            return
+        self.banned_until = until
+        self.code = code
+        self.reason = reason
+        logger.log('API', f"Binance banned IP ({code}). Requests wait {self.remaining:0.1f} sec.")
+        for hook in self._hooks:
+            res = hook(until, code, reason)
+            if asyncio.iscoroutine(res):
+                asyncio.ensure_future(res)
+
+    async def wait(self) -> None:
+        """**Wait until the gate is open**"""
+        while True:
+            remaining = self.remaining
+            if remaining <= 0:
+                return
+            await asyncio.sleep(remaining)
+
+    @staticmethod
+    def parse(status: int, headers, payload) -> Optional[float]:
+        """**Ban deadline of a response**
+            Return the timestamp in seconds until which requests must wait,
+            or None when the response is not a rate limit rejection.
+
+        Args:
+            status: HTTP status code
+            headers: response headers
+            payload: decoded response body
+        """
+        code = payload.get('code') if isinstance(payload, dict) else None
+        if status not in (418, 429) and code != -1003:
+            return None
+        now = time.time()
+        msg = payload.get('msg', '') if isinstance(payload, dict) else ''
+        found = _UNTIL.search(msg)
+        if found:
+            return int(found.group(1)) / 1000
+        retry_after = headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return now + int(retry_after)
+        # The request weight is counted per minute, it is reset at the next one.
+        return now - now % 60 + 60
+
+
+BAN_GATE = BanGate()
@@ -0,0 +1,158 @@
+import asyncio
+import time
+
+from aio_binance.error_handler.error import BinanceException
+
+# Most orders Binance accepts in one batchOrders request.
+BATCH_ORDERS = 5
+# Most ids Binance accepts in one cancel of multiple orders.
+BATCH_CANCEL = 10
+
+
+def _chunks(items: list, size: int) -> list[tuple[int, list]]:
+    """Split items into (index of the first item, items) chunks"""
+    return [(start, items[start:start + size]) for start in range(0, len(items), size)]
+
+
+class Bulk:
+
+    async def create_private_bulk_order(self,
+                                        orders: list[dict],
+                                        concurrency: int = 10) -> list[dict]:
+        """**Place any number of orders (TRADE)**
+            Orders are split into batches of five, the batches are sent concurrently
+            and wait for the order count limits of the client, so a whole grid is
+            placed in about the time of one request.
+
+        Notes:
+            ``POST /fapi/v1/batchOrders``
+        Args:
+            orders: list of orders as for ``create_private_batch_order()``.
+            concurrency: max number of batches in flight. Default 10
+        Returns:
+            list in the order of ``orders``: the order placed or ``{'code': ..., 'msg': ...}``
+            of an order that was rejected or whose batch failed.
+        Examples:
+            results = await client.create_private_bulk_order([
+                {'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'LIMIT', 'time_in_force': 'GTC',
+                 'quantity': '0.001', 'price': str(30000 - 10 * level)}
+                for level in range(50)])
+            failed = [number for number, result in enumerate(results) if 'code' in result]
+        """
+        results: list[dict | None] = [None] * len(orders)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def batch(chunk: list[int]) -> None:
+            async with semaphore:
+                try:
+                    placed = (await self.create_private_batch_order([orders[number] for number in chunk]))['data']
+                except BinanceException as err:
+                    if isinstance(err.msg, list):
+                        # Some orders were rejected, the error carries the whole batch.
+                        placed = err.msg
+                    else:
+                        # A failed batch fails every order of it.
+                        placed = [{'code': err.code, 'msg': err.msg} for _ in chunk]
+            for number, result in zip(chunk, placed):
+                results[number] = result
+
+        numbers = list(range(len(orders)))
+        if self.symbols is not None:
+            # An order that breaks a filter is not sent and does not fail its batch.
+            numbers = []
+            orders = self._to_api(orders)
+            for number, order in enumerate(orders):
+                try:
+                    await self._prepare_orders([order])
+                except BinanceException as err:
+                    results[number] = {'code': err.code, 'msg': err.msg}
+                else:
+                    numbers.append(number)
+        await self._run_all(batch(chunk) for _, chunk in _chunks(numbers, BATCH_ORDERS))
+        return results
+
+    async def delete_private_bulk_order(self,
+                                        orders: list[tuple[str, int | str]],
+                                        cancel_all: bool = False,
+                                        concurrency: int = 10) -> dict:
+        """**Cancel any number of orders across symbols (TRADE)**
+            Ids are grouped by symbol and split into batches of ten,
+            the batches are sent concurrently.
+
+        Notes:
+            ``DELETE /fapi/v1/batchOrders``, ``DELETE /fapi/v1/allOpenOrders``
+        Args:
+            orders: list of (symbol, id), an int id is the order id, a str id the client order id.
+            cancel_all: cancel all open orders of a symbol with one request when the list has
+                every open order of it and needs more than two batches. The open orders are
+                read first, an order placed in between is cancelled too, ids of the list that
+                were not open are not cancelled (-2011). If the open orders cannot be read,
+                the batches are used. Default False
+            concurrency: max number of requests in flight. Default 10
+        Returns:
+            ``{'orders': [...], 'elapsed': seconds}``, orders are in the order of the list:
+            ``{'symbol', 'id', 'cancelled', 'via', 'result'}`` where via is 'batch' or 'all'
+            and result is the cancelled order, the error ``{'code': ..., 'msg': ...}``
+            or the response of the cancel of all open orders.
+        Examples:
+            res = await client.delete_private_bulk_order([('BTCUSDT', 8389765), ('ETHUSDT', 'grid-17')])
+            failed = [row for row in res['orders'] if not row['cancelled']]
+        """
+        started = time.perf_counter()
+        rows = [{'symbol': symbol, 'id': order_id, 'cancelled': False, 'via': 'batch', 'result': None}
+                for symbol, order_id in orders]
+        # Order ids and client order ids of a symbol go in separate batches.
+        symbols: dict[str, dict[bool, list[int]]] = {}
+        for number, (symbol, order_id) in enumerate(orders):
+            symbols.setdefault(symbol, {}).setdefault(isinstance(order_id, int), []).append(number)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def batch(symbol: str, numbers: list[int]) -> None:
+            async with semaphore:
+                try:
+                    results = (await self.delete_private_batch_order(
+                        symbol, [orders[number][1] for number in numbers]))['data']
+                except BinanceException as err:
+                    if isinstance(err.msg, list):
+                        # Some orders were not cancelled, the error carries the whole batch.
+                        results = err.msg
+                    else:
+                        results = [{'code': err.code, 'msg': err.msg} for _ in numbers]
+            for number, result in zip(numbers, results):
+                rows[number].update(cancelled='code' not in result, result=result)
+
+        async def symbol_all(symbol: str, numbers: list[int]) -> bool:
+            async with semaphore:
+                try:
+                    open_orders = (await self.get_private_all_open_orders(symbol=symbol))['data']
+                except BinanceException:
+                    return False
+            ids = {orders[number][1] for number in numbers}
+            if not open_orders or any(order['orderId'] not in ids and order['clientOrderId'] not in ids
+                                      for order in open_orders):
+                return False
+            async with semaphore:
+                try:
+                    result = (await self.delete_private_all_open_orders(symbol))['data']
+                except BinanceException:
+                    return False
+            open_ids = {order['orderId'] for order in open_orders} | {order['clientOrderId'] for order in open_orders}
+            for number in numbers:
+                if orders[number][1] in open_ids:
+                    rows[number].update(cancelled=True, via='all', result=result)
+                else:
+                    # Not open when the orders were read, there was nothing to cancel.
+                    rows[number].update(cancelled=False, via='all',
+                                        result={'code': -2011, 'msg': 'Unknown order sent.'})
+            return True
+
+        async def symbol_orders(symbol: str, kinds: dict[bool, list[int]]) -> None:
+            chunks = [chunk for numbers in kinds.values() for _, chunk in _chunks(numbers, BATCH_CANCEL)]
+            # Reading the open orders and cancelling them all takes two requests.
+            if cancel_all and len(chunks) > 2 and \
+                    await symbol_all(symbol, [number for numbers in kinds.values() for number in numbers]):
+                return
+            await asyncio.gather(*(batch(symbol, chunk) for chunk in chunks))
+
+        await self._run_all(symbol_orders(symbol, kinds) for symbol, kinds in symbols.items())
+        return {'orders': rows, 'elapsed': time.perf_counter() - started}
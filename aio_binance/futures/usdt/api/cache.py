@@ -0,0 +1,117 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable
+
+from loguru import logger
+
+# Seconds a response of slow-changing data stays fresh.
+DEFAULT_TTL = {
+    'get_public_exchange_info': 60,
+    'get_public_index_info': 60,
+    'get_private_leverage_brackets': 300,
+    'get_private_commission_rate': 3600,
+}
+
+
+class ResponseCache:
+    """**Cache of responses with slow-changing data**
+        Responses are kept per method and parameters for the TTL of the method,
+        the least recently used entry is evicted when the cache is full.
+        With ``stale_while_revalidate`` an expired entry is still returned
+        at once while a fresh one is loaded in the background.
+
+        Cached results are shared by all callers, do not modify them.
+
+    Args:
+        ttl: (optional) dict of seconds per method name, merged into the defaults.
+            A TTL of 0 disables caching of the method.
+        maxsize: max number of entries. Default 256
+        stale_while_revalidate: seconds after expiry an entry may still be returned
+            while it is refreshed. Default 0, disabled
+    """
+
+    def __init__(self,
+                 ttl: dict = None,
+                 maxsize: int = 256,
+                 stale_while_revalidate: float = 0):
+        self.ttls = dict(DEFAULT_TTL)
+        self.ttls.update(ttl or {})
+        self.maxsize = maxsize
+        self.stale_while_revalidate = stale_while_revalidate
+        self._entries: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()
+        self._refreshing: dict[Hashable, asyncio.Task] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'stale_hits': 0, 'refreshes': 0, 'evictions': 0}
+
+    def ttl(self, name: str) -> float:
+        return self.ttls.get(name, 0)
+
+    def get(self, key: Hashable) -> tuple[object, float] | None:
+        """**Cached value and its age past expiry in seconds, negative while fresh**"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        self._entries.move_to_end(key)
+        return value, time.monotonic() - expires
+
+    def set(self, key: Hashable, value, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def invalidate(self, name: str = None) -> None:
+        """**Drop cached responses**
+
+        Args:
+            name: (optional) method name, all entries are dropped if not passed
+        """
+        if name is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == name]:
+            del self._entries[key]
+
+    async def fetch(self, key: Hashable, factory: Callable[[], Awaitable]):
+        """**Return the cached response of the key or load it**
+
+        Args:
+            key: tuple starting with the method name
+            factory: function that sends the request
+        """
+        ttl = self.ttl(key[0])
+        cached = self.get(key)
+        if cached is not None:
+            value, age = cached
+            if age < 0:
+                self._stats['hits'] += 1
+                return value
+            if age < self.stale_while_revalidate:
+                self._stats['stale_hits'] += 1
+                self.__refresh(key, factory, ttl)
+                return value
+        self._stats['misses'] += 1
+        value = await factory()
+        self.set(key, value, ttl)
+        return value
+
+    def __refresh(self, key: Hashable, factory: Callable[[], Awaitable], ttl: float) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                self.set(key, await factory(), ttl)
+                self._stats['refreshes'] += 1
+            except Exception as err:
+                logger.warning(f"(Binance Futures Api) Cache refresh of {key[0]}() failed | Exception {err}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.ensure_future(refresh())
+
+    @property
+    def stats(self) -> dict:
+        return dict(self._stats, size=len(self._entries), maxsize=self.maxsize)
@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+from loguru import logger
+
+
+class TimeSync:
+    """**Synchronisation with the server clock**
+        The offset to the server clock is estimated NTP style: the server time
+        is compared with the midpoint of the request, and of several samples
+        the one with the shortest round trip wins. The offset is refreshed
+        in the background and used for the ``timestamp`` of signed requests.
+
+    Args:
+        interval: seconds between synchronisations. Default 60
+        samples: requests per synchronisation. Default 5
+        offset: initial offset in milliseconds used until the first
+            synchronisation. Default -1000, one second behind the local clock
+    """
+
+    def __init__(self,
+                 interval: float = 60,
+                 samples: int = 5,
+                 offset: float = -1000):
+        self.interval = interval
+        self.samples = samples
+        self.offset = offset
+        self.rtt: float | None = None
+        self.synced_at: float | None = None
+        self.syncs = 0
+        self.errors = 0
+        self._task: asyncio.Task = None
+
+    def timestamp(self) -> int:
+        """**Current server time in milliseconds**"""
+        return int(time.time() * 1000 + self.offset)
+
+    def shift(self, milliseconds: float) -> None:
+        self.offset += milliseconds
+
+    async def sync(self, api) -> float:
+        """**Measure the offset now**
+
+        Args:
+            api: client used for ``get_public_time()``
+        Returns:
+            offset in milliseconds
+        """
+        best_rtt = best_offset = None
+        for _ in range(self.samples):
+            sent = time.time()
+            started = time.perf_counter()
+            with api.response_mode('full'):
+                res = await api.get_public_time()
+            rtt = (time.perf_counter() - started) * 1000
+            midpoint = (sent * 1000) + rtt / 2
+            if best_rtt is None or rtt < best_rtt:
+                best_rtt = rtt
+                best_offset = res['data']['serverTime'] - midpoint
+        self.offset = best_offset
+        self.rtt = best_rtt
+        self.synced_at = time.time()
+        self.syncs += 1
+        logger.log('API', f"      Server clock offset {self.offset:0.1f} ms, round trip {self.rtt:0.1f} ms")
+        return self.offset
+
+    async def __run(self, api) -> None:
+        while True:
+            try:
+                await self.sync(api)
+            except Exception as err:
+                self.errors += 1
+                logger.warning(f"(Binance Futures Api) Server time sync failed | Exception {err}")
+            await asyncio.sleep(self.interval)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, api) -> None:
+        """**Start background synchronisation**"""
+        if not self.running:
+            self._task = asyncio.ensure_future(self.__run(api))
+
+    def resync(self, api) -> None:
+        """**Synchronise at once, restarting the background loop**"""
+        if self._task is not None:
+            self._task.cancel()
+        self._task = asyncio.ensure_future(self.__run(api))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            'offset_ms': round(self.offset, 3),
+            'rtt_ms': round(self.rtt, 3) if self.rtt is not None else None,
+            'synced_at': self.synced_at,
+            'syncs': self.syncs,
+            'errors': self.errors
+        }
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable
+
+
+class Singleflight:
+    """**Coalescing of identical requests in flight**
+        While a request is on its way, the same request (same path and
+        parameters) does not go to Binance again: every caller awaits
+        the first one and receives the same result object.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable]):
+        """**Run the request once for all concurrent callers of the key**
+
+        Args:
+            key: identity of the request
+            factory: function that starts the request
+        """
+        call = self._calls.get(key)
+        if call is None:
+            self.requests += 1
+            call = asyncio.ensure_future(factory())
+            self._calls[key] = call
+            call.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.coalesced += 1
+        # A cancelled caller must not cancel the request of the others.
+        return await asyncio.shield(call)
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            'requests': self.requests,
+            'coalesced': self.coalesced,
+            'in_flight': len(self._calls)
+        }
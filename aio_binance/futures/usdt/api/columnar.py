@@ -0,0 +1,208 @@
+import re
+import string
+import warnings
+
+import ujson
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Kline row: [open time, open, high, low, close, volume, close time,
+# quote asset volume, number of trades, taker buy base asset volume,
+# taker buy quote asset volume, ignore]
+KLINE_COLUMNS = (
+    ('open_time', 0, 'int64'),
+    ('open', 1, 'float64'),
+    ('high', 2, 'float64'),
+    ('low', 3, 'float64'),
+    ('close', 4, 'float64'),
+    ('volume', 5, 'float64'),
+    ('close_time', 6, 'int64'),
+    ('quote_volume', 7, 'float64'),
+    ('trades', 8, 'int64'),
+    ('taker_buy_volume', 9, 'float64'),
+    ('taker_buy_quote_volume', 10, 'float64'),
+)
+
+AGG_TRADE_COLUMNS = (
+    ('id', 'a', 'int64'),
+    ('price', 'p', 'float64'),
+    ('quantity', 'q', 'float64'),
+    ('first_id', 'f', 'int64'),
+    ('last_id', 'l', 'int64'),
+    ('time', 'T', 'int64'),
+    ('buyer_maker', 'm', 'bool'),
+)
+
+TRADE_COLUMNS = (
+    ('id', 'id', 'int64'),
+    ('price', 'price', 'float64'),
+    ('quantity', 'qty', 'float64'),
+    ('quote_quantity', 'quoteQty', 'float64'),
+    ('time', 'time', 'int64'),
+    ('buyer_maker', 'isBuyerMaker', 'bool'),
+)
+
+FUNDING_RATE_COLUMNS = (
+    ('funding_time', 'fundingTime', 'int64'),
+    ('funding_rate', 'fundingRate', 'float64'),
+    ('mark_price', 'markPrice', 'float64'),
+)
+_RECORD_NOISE = string.ascii_letters.encode() + b'[]{}":'
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "Columnar results need numpy, please install it: pip install aio-binance-library[numpy]")
+
+
+def rows_to_columns(rows: list[list], columns: tuple) -> dict:
+    """**Convert list of rows into a dict of typed numpy arrays**
+
+    Args:
+        rows: rows as returned by Binance, lists or dicts
+        columns: tuple of (name, index or key in the row, numpy dtype)
+    """
+    require_numpy()
+    if not rows:
+        return {name: np.empty(0, dtype=dtype) for name, _, dtype in columns}
+    return {
+        name: np.array([row[index] for row in rows], dtype=dtype)
+        for name, index, dtype in columns
+    }
+
+
+def concat_columns(parts: list[dict], columns: tuple, key: str,
+                   start: int = None, end: int = None) -> dict:
+    """**Join pages of columns, sorted and de-duplicated by the key column**
+
+    Args:
+        parts: pages of columns
+        columns: tuple of (name, index in the row, numpy dtype)
+        key: name of the column that identifies a row
+        start: (optional) drop rows with the key lower than start
+        end: (optional) drop rows with the key equal or greater than end
+    """
+    require_numpy()
+    if not parts:
+        return rows_to_columns([], columns)
+    joined = {name: np.concatenate([part[name] for part in parts]) for name, _, _ in columns}
+    values, index = np.unique(joined[key], return_index=True)
+    if start is not None:
+        index = index[values >= start]
+        values = values[values >= start]
+    if end is not None:
+        index = index[values < end]
+    return {name: column[index] for name, column in joined.items()}
+
+
+def _numbers(raw: bytes, width: int):
+    """Parse comma separated numbers into a (rows, width) float64 matrix, None when malformed"""
+    with warnings.catch_warnings():
+        # numpy < 2 warns instead of raising on unmatched data.
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            values = np.fromstring(raw, sep=',')
+        except (ValueError, DeprecationWarning):
+            return None
+    if values.size % width:
+        return None
+    return values.reshape(-1, width)
+
+
+def _matrix_to_columns(matrix, columns: tuple, positions: dict) -> dict:
+    return {
+        name: np.ascontiguousarray(matrix[:, positions[index]]).astype(dtype, copy=False)
+        for name, index, dtype in columns
+    }
+
+
+def decode_klines(raw: bytes | str) -> dict:
+    """**Decode a klines response into a dict of typed numpy arrays in one pass**"""
+    require_numpy()
+    if isinstance(raw, str):
+        raw = raw.encode()
+    matrix = _numbers(raw.translate(None, b'[]"'), 12)
+    if matrix is None:
+        return rows_to_columns(ujson.loads(raw), KLINE_COLUMNS)
+    return _matrix_to_columns(matrix, KLINE_COLUMNS, {index: index for _, index, _ in KLINE_COLUMNS})
+
+
+def _depth_side(raw: bytes, side: bytes):
+    start = raw.index(side) + len(side)
+    if raw.startswith(b'[]', start):
+        return np.empty((0, 2))
+    end = raw.index(b']]', start) + 2
+    levels = _numbers(raw[start:end].translate(None, b'[]"'), 2)
+    if levels is None:
+        levels = np.array(ujson.loads(raw[start:end]), dtype='float64').reshape(-1, 2)
+    return levels
+
+
+def _header_int(raw: bytes, key: bytes) -> int | None:
+    found = re.search(rb'"' + key + rb'":(\d+)', raw)
+    return int(found.group(1)) if found else None
+
+
+def decode_depth(raw: bytes | str) -> dict:
+    """**Decode an order book response**
+        Bids and asks become (levels, 2) float64 arrays of [price, quantity].
+    """
+    require_numpy()
+    if isinstance(raw, str):
+        raw = raw.encode()
+    return {
+        'last_update_id': _header_int(raw, b'lastUpdateId'),
+        'event_time': _header_int(raw, b'E'),
+        'transaction_time': _header_int(raw, b'T'),
+        'bids': _depth_side(raw, b'"bids":'),
+        'asks': _depth_side(raw, b'"asks":')
+    }
+
+
+def _decode_records(raw: bytes | str, columns: tuple) -> dict:
+    """Decode a list of flat JSON objects with the same keys in the same order"""
+    require_numpy()
+    if isinstance(raw, str):
+        raw = raw.encode()
+    if raw.find(b'{') < 0:
+        return rows_to_columns(ujson.loads(raw), columns)
+    first = raw[raw.index(b'{'):raw.index(b'}') + 1]
+    wanted = {key for _, key, _ in columns}
+    kept = []
+    numbers = raw
+    for key in ujson.loads(first):
+        if key in wanted:
+            kept.append(key)
+            continue
+        # Text fields, e.g. the symbol, are the same in every row of a response,
+        # a row with another value fails the parsing below and falls back.
+        field = re.search(rb'"' + re.escape(key.encode()) + rb'":("[^"]*"|[^,}]*)', first).group(0)
+        numbers = numbers.replace(field + b',', b'').replace(b',' + field, b'')
+    if b'true' in numbers or b'false' in numbers:
+        numbers = numbers.replace(b'true', b'1').replace(b'false', b'0')
+    if b'""' not in numbers and all(key.isalpha() for key in kept):
+        # Only the keys have letters left, one pass drops them with the punctuation.
+        numbers = numbers.translate(None, _RECORD_NOISE)
+    else:
+        for key in kept:
+            numbers = numbers.replace(b'"' + key.encode() + b'":', b'')
+        # Empty strings, e.g. markPrice of old funding rates, become NaN.
+        numbers = numbers.replace(b'""', b'nan').translate(None, b'[]{}"')
+    matrix = _numbers(numbers, len(kept))
+    if matrix is None or len(matrix) != raw.count(b'{'):
+        return rows_to_columns(ujson.loads(raw.replace(b'""', b'"nan"')), columns)
+    return _matrix_to_columns(matrix, columns, {key: position for position, key in enumerate(kept)})
+
+
+def decode_agg_trades(raw: bytes | str) -> dict:
+    """**Decode an aggregate trades response into a dict of typed numpy arrays**"""
+    return _decode_records(raw, AGG_TRADE_COLUMNS)
+
+
+def decode_funding_rate(raw: bytes | str) -> dict:
+    """**Decode a funding rate history response into a dict of typed numpy arrays**"""
+    return _decode_records(raw, FUNDING_RATE_COLUMNS)
@@ -0,0 +1,198 @@
+import asyncio
+import time
+from typing import AsyncIterator, Callable
+
+from aio_binance.futures.usdt.api.columnar import AGG_TRADE_COLUMNS, KLINE_COLUMNS, TRADE_COLUMNS, \
+    concat_columns, require_numpy, rows_to_columns
+
+INTERVALS = {
+    '1m': 60_000,
+    '3m': 180_000,
+    '5m': 300_000,
+    '15m': 900_000,
+    '30m': 1_800_000,
+    '1h': 3_600_000,
+    '2h': 7_200_000,
+    '4h': 14_400_000,
+    '6h': 21_600_000,
+    '8h': 28_800_000,
+    '12h': 43_200_000,
+    '1d': 86_400_000,
+    '3d': 259_200_000,
+    '1w': 604_800_000,
+    # The longest month, a window may return fewer rows than the limit.
+    '1M': 2_678_400_000,
+}
+
+# Longest range of aggTrades requested with start_time and end_time.
+AGG_TRADES_WINDOW = 3_600_000
+
+KLINE_METHODS = {
+    'klines': 'get_public_klines',
+    'continuous': 'get_public_continuous_klines',
+    'index_price': 'get_public_index_price_klines',
+    'mark_price': 'get_public_mark_price_klines',
+}
+
+
+class History:
+
+    async def get_public_klines_history(self,
+                                        symbol: str,
+                                        interval: str,
+                                        start_time: int,
+                                        end_time: int = None,
+                                        kind: str = 'klines',
+                                        contract_type: str = 'PERPETUAL',
+                                        limit: int = 1000,
+                                        concurrency: int = 5,
+                                        progress: Callable = None) -> dict:
+        """**Bulk download of klines for a time range**
+            The range ``[start_time, end_time)`` is split into windows of ``limit`` klines
+            that are fetched concurrently under the rate limits, with the ``backfill`` priority.
+            Pages are joined in time order without duplicates.
+
+        Notes:
+            Needs numpy: ``pip install aio-binance-library[numpy]``
+        Args:
+            symbol: the trading symbol or pair.
+            interval: the interval of kline, e.g. 1m, 5m, 1h, 1d, etc.
+            start_time: start time in ms, inclusive.
+            end_time: end time in ms, exclusive. Default now
+            kind: 'klines', 'continuous', 'index_price' or 'mark_price'. Default 'klines'
+            contract_type: contract type of 'continuous' klines. Default 'PERPETUAL'
+            limit: klines per request. Default 1000
+            concurrency: requests in flight at once. Default 5
+            progress: (optional) function or coroutine function
+                called with (pages done, pages total, klines received) after each page.
+        Returns:
+            dict of numpy arrays: open_time, open, high, low, close, volume, close_time,
+            quote_volume, trades, taker_buy_volume, taker_buy_quote_volume
+        Examples:
+            klines = await client.get_public_klines_history('BTCUSDT', '1m', 1640995200000, 1643673600000)
+
+            print(klines['close'].mean())
+        Notes:
+            Cancel the task awaiting the download to stop it, requests in flight are cancelled too.
+        """
+        require_numpy()
+        assert kind in KLINE_METHODS, f"Kind must be one of {tuple(KLINE_METHODS)}"
+        assert interval in INTERVALS, f"Interval must be one of {tuple(INTERVALS)}"
+        if end_time is None:
+            end_time = int(time.time() * 1000)
+        step = INTERVALS[interval] * limit
+        windows = [(start, min(start + step, end_time) - 1) for start in range(start_time, end_time, step)]
+        fetch = getattr(self, KLINE_METHODS[kind])
+        args = (symbol, contract_type, interval) if kind == 'continuous' else (symbol, interval)
+        semaphore = asyncio.Semaphore(concurrency)
+        pages = [None] * len(windows)
+        received = done = 0
+
+        async def page(number: int, start: int, end: int) -> None:
+            nonlocal received, done
+            async with semaphore:
+                res = await fetch(*args, start_time=start, end_time=end, limit=limit, columnar=True)
+            pages[number] = res['data']
+            received += len(res['data']['open_time'])
+            done += 1
+            if progress is not None:
+                called = progress(done, len(windows), received)
+                if asyncio.iscoroutine(called):
+                    await called
+
+        await self._run_all(page(number, *window) for number, window in enumerate(windows))
+        return concat_columns(pages, KLINE_COLUMNS, 'open_time', start_time, end_time)
+
+    async def iter_public_agg_trades(self,
+                                     symbol: str,
+                                     start_time: int,
+                                     end_time: int = None,
+                                     limit: int = 1000,
+                                     columnar: bool = False) -> AsyncIterator[list | dict]:
+        """**Stream aggregate trades of a time range in batches**
+            The first trade is searched in windows of one hour, as Binance allows
+            no more between start_time and end_time, then the pages follow by ``from_id``.
+            The next page is requested while the current batch is processed,
+            only one page is held ahead, so memory stays bounded.
+
+        Args:
+            symbol: the trading symbol.
+            start_time: start time in ms, inclusive.
+            end_time: end time in ms, exclusive. Default now
+            limit: trades per request, max 1000. Default 1000
+            columnar: yield dicts of numpy arrays instead of lists of trades. Default False
+        Examples:
+            async for batch in client.iter_public_agg_trades('BTCUSDT', 1640995200000, 1641081600000):
+                print(len(batch), batch[-1]['T'])
+        """
+        if columnar:
+            require_numpy()
+        if end_time is None:
+            end_time = int(time.time() * 1000)
+        trades = []
+        window = start_time
+        while not trades and window < end_time:
+            with self.response_mode('full'):
+                res = await self.get_public_agg_trades(
+                    symbol,
+                    start_time=window,
+                    end_time=min(window + AGG_TRADES_WINDOW, end_time) - 1,
+                    limit=limit)
+            trades = res['data']
+            window += AGG_TRADES_WINDOW
+        next_page = None
+        try:
+            while trades:
+                last = trades[-1]['T'] >= end_time
+                if not last:
+                    with self.response_mode('full'):
+                        next_page = asyncio.ensure_future(
+                            self.get_public_agg_trades(symbol, from_id=trades[-1]['a'] + 1, limit=limit))
+                else:
+                    trades = [trade for trade in trades if trade['T'] < end_time]
+                if trades:
+                    yield rows_to_columns(trades, AGG_TRADE_COLUMNS) if columnar else trades
+                if next_page is None:
+                    return
+                trades = (await next_page)['data']
+                next_page = None
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def iter_public_historical_trades(self,
+                                            symbol: str,
+                                            from_id: int,
+                                            to_id: int = None,
+                                            limit: int = 1000,
+                                            columnar: bool = False) -> AsyncIterator[list | dict]:
+        """**Stream historical trades by id in batches**
+            The next page is requested while the current batch is processed.
+
+        Args:
+            symbol: the trading symbol.
+            from_id: first trade id, inclusive.
+            to_id: (optional) last trade id, inclusive. Default up to the most recent trade
+            limit: trades per request, max 1000. Default 1000
+            columnar: yield dicts of numpy arrays instead of lists of trades. Default False
+        """
+        if columnar:
+            require_numpy()
+        with self.response_mode('full'):
+            next_page = asyncio.ensure_future(
+                self.get_public_historical_trades(symbol, from_id=from_id, limit=limit))
+        try:
+            while next_page is not None:
+                trades = (await next_page)['data']
+                next_page = None
+                if to_id is not None and trades and trades[-1]['id'] >= to_id:
+                    trades = [trade for trade in trades if trade['id'] <= to_id]
+                elif len(trades) == limit:
+                    with self.response_mode('full'):
+                        next_page = asyncio.ensure_future(
+                            self.get_public_historical_trades(symbol, from_id=trades[-1]['id'] + 1, limit=limit))
+                if trades:
+                    yield rows_to_columns(trades, TRADE_COLUMNS) if columnar else trades
+        finally:
+            if next_page is not None:
+                next_page.cancel()
@@ -0,0 +1,254 @@
+import asyncio
+import time
+
+
+def _depth_weight(params: dict) -> int:
+    limit = int(params.get('limit', 500))
+    if limit <= 50:
+        return 2
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 10
+    return 20
+
+
+def _klines_weight(params: dict) -> int:
+    limit = int(params.get('limit', 500))
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+def _symbol_weight(with_symbol: int, without_symbol: int):
+    def weight(params: dict) -> int:
+        return with_symbol if params.get('symbol') else without_symbol
+    return weight
+
+
+# Request weight of every method on the IP limit X-MBX-USED-WEIGHT-1M.
+# See Also: https://binance-docs.github.io/apidocs/futures/en/#limits
+WEIGHTS = {
+    # Market
+    'get_public_ping': 1,
+    'get_public_time': 1,
+    'get_public_exchange_info': 1,
+    'get_public_depth': _depth_weight,
+    'get_public_trades': 5,
+    'get_public_historical_trades': 20,
+    'get_public_agg_trades': 20,
+    'get_public_klines': _klines_weight,
+    'get_public_continuous_klines': _klines_weight,
+    'get_public_index_price_klines': _klines_weight,
+    'get_public_mark_price_klines': _klines_weight,
+    'get_public_mark_price': _symbol_weight(1, 10),
+    'get_public_funding_rate': 1,
+    'get_public_ticker_24hr_price_change': _symbol_weight(1, 40),
+    'get_public_ticker_price': _symbol_weight(1, 2),
+    'get_public_book_ticker': _symbol_weight(1, 2),
+    'get_public_open_interest': 1,
+    'get_public_blvt_kline': 1,
+    'get_public_index_info': 1,
+    'get_public_asset_index': _symbol_weight(1, 10),
+    # Account
+    'change_private_position_mode': 1,
+    'get_private_position_mode': 30,
+    'change_private_multi_asset_mode': 1,
+    'get_private_multi_asset_mode': 30,
+    'create_private_order': 0,
+    'create_private_order_test': 1,
+    'create_private_batch_order': 5,
+    'get_private_order': 1,
+    'delete_private_order': 1,
+    'delete_private_all_open_orders': 1,
+    'delete_private_batch_order': 1,
+    'delete_private_order_countdown': 10,
+    'get_private_open_order': 1,
+    'get_private_all_open_orders': _symbol_weight(1, 40),
+    'get_private_all_orders': 5,
+    'get_private_balance': 5,
+    'get_private_account_info': 5,
+    'change_private_leverage': 1,
+    'change_private_margin_type': 1,
+    'change_private_isolated_position_margin': 1,
+    'get_private_position_margin_history': 1,
+    'get_private_position_risk': 5,
+    'get_private_account_trades': 5,
+    'get_private_income_history': 30,
+    'get_private_leverage_brackets': 1,
+    'get_private_adl_quantile': 5,
+    'get_private_force_orders': _symbol_weight(20, 50),
+    'get_private_api_trading_status': _symbol_weight(1, 10),
+    'get_private_commission_rate': 20,
+    # DataStream
+    'create_private_listen_key': 1,
+    'update_private_listen_key': 1,
+    'delete_private_listen_key': 1,
+}
+
+# Order count of the methods on the account limits
+# X-MBX-ORDER-COUNT-10S and X-MBX-ORDER-COUNT-1M.
+ORDER_COUNTS = {
+    'create_private_order': (1, 1),
+    'create_private_batch_order': (5, 1),
+}
+
+
+class TokenBucket:
+    """**Token bucket of one rate limit**
+        Tokens are reserved in the order requests arrive, a request that
+        finds the bucket empty sleeps until its share has been refilled.
+
+    Args:
+        capacity: number of tokens per period
+        period: period in seconds
+    """
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.period = period
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self._updated = time.monotonic()
+        self.waiting = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.acquired = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        """**Tokens left now, negative when requests are queued**"""
+        self._refill()
+        return self.tokens
+
+    def reserve(self, amount: float) -> float:
+        """**Take tokens now, return seconds to wait until they are covered**"""
+        amount = min(amount, self.capacity)
+        self._refill()
+        self.tokens -= amount
+        self.acquired += amount
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def release(self, amount: float) -> None:
+        """**Return reserved tokens of a request that has not been sent**"""
+        amount = min(amount, self.capacity)
+        self.tokens = min(self.capacity, self.tokens + amount)
+        self.acquired -= amount
+
+    async def acquire(self, amount: float) -> None:
+        if amount <= 0:
+            return
+        await self.settle(amount, self.reserve(amount))
+
+    async def settle(self, amount: float, delay: float) -> None:
+        """**Wait until tokens taken with reserve() are covered, they are returned if cancelled**"""
+        if delay <= 0:
+            return
+        self.waiting += 1
+        self.waits += 1
+        self.wait_time += delay
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.release(amount)
+            raise
+        finally:
+            self.waiting -= 1
+
+    def reconcile(self, used: int) -> None:
+        """**Align the bucket with the usage reported by the server**"""
+        self._refill()
+        self.tokens = min(self.tokens, self.capacity - used)
+
+    @property
+    def metrics(self) -> dict:
+        self._refill()
+        return {
+            'capacity': self.capacity,
+            'available': round(self.tokens, 2),
+            'utilisation': round(1 - max(self.tokens, 0) / self.capacity, 4),
+            'waiting': self.waiting,
+            'waits': self.waits,
+            'wait_time': round(self.wait_time, 3),
+            'acquired': round(self.acquired, 2)
+        }
+
+
+# The request weight is counted per IP, so it is shared by all clients of the process.
+IP_WEIGHT = TokenBucket(2400, 60)
+
+
+class RateLimiter:
+    """**Client side rate limiter**
+        Requests wait in turn instead of being rejected by Binance
+        with 429 and, when repeated, an IP ban.
+
+    Args:
+        weight: (optional) TokenBucket of the IP weight, shared by all clients by default
+        orders_10s: order count limit per 10 seconds of the account. Default 300
+        orders_1m: order count limit per minute of the account. Default 1200
+    """
+
+    def __init__(self,
+                 weight: TokenBucket = None,
+                 orders_10s: int = 300,
+                 orders_1m: int = 1200):
+        self.weight = weight or IP_WEIGHT
+        self.orders_10s = TokenBucket(orders_10s, 10)
+        self.orders_1m = TokenBucket(orders_1m, 60)
+
+    @staticmethod
+    def cost(name: str, params: dict) -> tuple[int, int, int]:
+        """**Weight and order counts of a request**
+
+        Args:
+            name: name of the method
+            params: parameters of the request as they are sent to Binance
+        Returns:
+            (weight, orders per 10 seconds, orders per minute)
+        """
+        weight = WEIGHTS.get(name, 1)
+        if callable(weight):
+            weight = weight(params)
+        orders_10s, orders_1m = ORDER_COUNTS.get(name, (0, 0))
+        return weight, orders_10s, orders_1m
+
+    async def acquire(self, cost: tuple[int, int, int]) -> None:
+        """**Wait until the request fits into every limit**
+
+        Args:
+            cost: (weight, orders per 10 seconds, orders per minute) from cost()
+        """
+        weight, orders_10s, orders_1m = cost
+        await self.orders_10s.acquire(orders_10s)
+        await self.orders_1m.acquire(orders_1m)
+        await self.weight.acquire(weight)
+
+    def update(self, headers) -> None:
+        """**Reconcile the buckets with X-MBX-* headers of a response**"""
+        used = headers.get('X-MBX-USED-WEIGHT-1M')
+        if used:
+            self.weight.reconcile(int(used))
+        used = headers.get('X-MBX-ORDER-COUNT-10S')
+        if used:
+            self.orders_10s.reconcile(int(used))
+        used = headers.get('X-MBX-ORDER-COUNT-1M')
+        if used:
+            self.orders_1m.reconcile(int(used))
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            'weight': self.weight.metrics,
+            'orders_10s': self.orders_10s.metrics,
+            'orders_1m': self.orders_1m.metrics
+        }
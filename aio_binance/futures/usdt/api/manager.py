@@ -1,31 +1,171 @@
+import asyncio
+from contextlib import contextmanager
+from typing import Coroutine, Iterable
+
+from aio_binance.futures.usdt.api.bulk import Bulk
+from aio_binance.futures.usdt.api.history import History
 from aio_binance.futures.usdt.api.methods.account import Account
 from aio_binance.futures.usdt.api.methods.market import Market
 from aio_binance.futures.usdt.api.methods.stream import DataStream
-from aio_binance.futures.usdt.api.query import Api
+from aio_binance.futures.usdt.api.params import to_api, to_api_batch, to_camel
+from aio_binance.futures.usdt.api.query import RESPONSE, RESPONSE_MODES, Api
+from aio_binance.futures.usdt.api.scheduler import PRIORITIES, PRIORITY
+from aio_binance.futures.usdt.api.symbols import SymbolIndex
+from aio_binance.futures.usdt.api.transport import Transport
 
 
 class FactoryApi(Api,
                  Market,
                  DataStream,
-                 Account):
+                 Account,
+                 Bulk,
+                 History):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A transport passed in belongs to its owner, e.g. an account pool. The pool
+        # also marks its shared clock, a TimeSync() given to a client is the client's.
+        self._own_transport = kwargs.get('transport') is None
+        self._own_clock = kwargs.get('own_clock', True)
+        self.transport: Transport = kwargs.get('transport') or Transport(session=kwargs.get('session'),
+                                                                         **kwargs.get('connector', {}))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """**Stop the time sync and close the connection pool of the client, unless they are shared**"""
+        if self._own_clock:
+            await self.clock.stop()
+        if self._own_transport:
+            await self.transport.aclose()
+
+    @property
+    def pool_stats(self) -> dict:
+        """**Connection pool statistics**"""
+        return self.transport.stats
+
+    @property
+    def limiter_stats(self) -> dict:
+        """**Utilisation of the rate limits**"""
+        return self.limiter.metrics
+
+    @property
+    def scheduler_stats(self) -> dict:
+        """**Queue depth and wait time per priority class**"""
+        return self.scheduler.metrics
+
+    @property
+    def coalesce_stats(self) -> dict:
+        """**Counters of coalesced public requests**"""
+        return self.singleflight.metrics if self.singleflight else {}
+
+    @property
+    def cache_stats(self) -> dict:
+        """**Hits, misses and size of the response cache**"""
+        return self.cache.stats if self.cache else {}
+
+    @property
+    def clock_stats(self) -> dict:
+        """**Offset to the server clock and round trip in milliseconds**"""
+        return self.clock.metrics
+
+    @property
+    def limit_usage(self) -> dict:
+        """**Rate limit usage reported by the last response**
+            Read it instead of ``limit_usage`` of every result in the 'data' and 'raw' response modes.
+        """
+        headers = self.last_headers
+        return {
+            'used_weight_1m': int(headers.get('X-MBX-USED-WEIGHT-1M', 0)),
+            'order_count_10s': int(headers.get('X-MBX-ORDER-COUNT-10S', 0)),
+            'order_count_1m': int(headers.get('X-MBX-ORDER-COUNT-1M', 0))
+        }
+
+    async def sync_time(self) -> float:
+        """**Measure the offset to the server clock now**
+
+        Returns:
+            offset in milliseconds
+        """
+        return await self.clock.sync(self)
+
+    async def load_symbols(self) -> SymbolIndex:
+        """**Load the trading rules of all symbols from exchange info**
+            With ``symbols=True`` of the client they are loaded on the first order,
+            call it again to refresh them.
+        """
+        if self.symbols is None:
+            self.symbols = SymbolIndex()
+        with self.response_mode('full'):
+            res = await self.get_public_exchange_info()
+        self.symbols.load(res['data'])
+        return self.symbols
+
+    async def _prepare_orders(self, orders: list[dict]) -> None:
+        """Quantize and check orders with Binance parameter names when the client has symbols"""
+        if self.symbols is None:
+            return
+        if not self.symbols:
+            await self.load_symbols()
+        for order in orders:
+            self.symbols.prepare(order)
+
+    @contextmanager
+    def priority(self, name: str):
+        """**Send requests of the block with the priority class**
+
+        Args:
+            name: 'trade', 'account', 'market' or 'backfill'
+        Examples:
+            with client.priority('backfill'):
+                await client.get_public_klines('BTCUSDT', '1m', limit=1000)
+        """
+        assert name in PRIORITIES, f"Priority must be one of {PRIORITIES}"
+        token = PRIORITY.set(name)
+        try:
+            yield
+        finally:
+            PRIORITY.reset(token)
+
+    @contextmanager
+    def response_mode(self, mode: str):
+        """**Return the results of requests in the block in the response mode**
+
+        Args:
+            mode: 'full' dict with data, 'data' payload only or 'raw' body bytes
+        Examples:
+            with client.response_mode('raw'):
+                body = await client.get_public_depth('BTCUSDT', limit=1000)
+        """
+        assert mode in RESPONSE_MODES, f"Response must be one of {RESPONSE_MODES}"
+        token = RESPONSE.set(mode)
+        try:
+            yield
+        finally:
+            RESPONSE.reset(token)
 
     # UTILS
+    async def _run_all(self, coros: Iterable[Coroutine]) -> list:
+        """Run coroutines as concurrent tasks with full responses, none is left running on error or cancellation"""
+        with self.response_mode('full'):
+            tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
     @staticmethod
     def _snake_to_camel(snake_str: str) -> str:
-        components = snake_str.split('_')
-        return components[0] + ''.join(x.title() for x in components[1:])
+        return to_camel(snake_str)
 
     def _to_api(self, data: dict | list) -> dict | list:
-        _data = None
         if isinstance(data, dict):
-            _data = dict()
-            for key, value in data.items():
-                _data[self._snake_to_camel(key)] = value
-        elif isinstance(data, list):
-            _data = list()
-            for item in data:
-                _d = dict()
-                for key, value in item.items():
-                    _d[self._snake_to_camel(key)] = value
-                _data.append(_d)
-        return _data
+            return to_api(data)
+        if isinstance(data, list):
+            return to_api_batch(data)
+        return None
@@ -1,6 +1,3 @@
-import ujson
-
-
 class Account:
 
     async def change_private_position_mode(self, dual_side_position: str) -> dict:
@@ -74,7 +71,8 @@ class Account:
                                    type_order: str,
                                    **kwargs) -> dict:
         """**New Order (TRADE)**
-            Send a new order
+            Send a new order. With ``symbols=True`` of the client the prices are put on the tick size,
+            the quantity on the step size and the filters are checked before sending.
 
         Notes:
             ``POST /fapi/v1/order``
@@ -104,14 +102,13 @@ class Account:
                             Use with STOP/STOP_MARKET or TAKE_PROFIT/TAKE_PROFIT_MARKET orders.
             new_order_resp_type: (str) "ACK" or "RESULT", async default "ACK".
         """
+        order = {'symbol': symbol, 'side': side, 'type': type_order, **self._to_api(kwargs)}
+        await self._prepare_orders([order])
         return await self._fetch(
             'POST',
             'create_private_order',
             '/fapi/v1/order',
-            symbol=symbol,
-            side=side,
-            type=type_order,
-            **self._to_api(kwargs)
+            **order
         )
 
     async def create_private_order_test(self,
@@ -120,7 +117,8 @@ class Account:
                                         type_order: str,
                                         **kwargs) -> dict:
         """**New Test Order (TRADE)**
-            Send a new test order
+            Send a new test order. With ``symbols=True`` of the client the prices are put on the tick size,
+            the quantity on the step size and the filters are checked before sending.
         Notes:
             ``POST /fapi/v1/order/test``
         See Also:
@@ -149,19 +147,19 @@ class Account:
                             Use with STOP/STOP_MARKET or TAKE_PROFIT/TAKE_PROFIT_MARKET orders.
             new_order_resp_type: (str) "ACK" or "RESULT", async default "ACK".
         """
+        order = {'symbol': symbol, 'side': side, 'type': type_order, **self._to_api(kwargs)}
+        await self._prepare_orders([order])
         return await self._fetch(
             'POST',
             'create_private_order_test',
             '/fapi/v1/order/test',
-            symbol=symbol,
-            side=side,
-            type=type_order,
-            **self._to_api(kwargs)
+            **order
         )
 
     async def create_private_batch_order(self, batch_orders: list[dict]) -> dict:
         """**Place Multiple Orders (TRADE)**
-            Post a new batch order*
+            Post a new batch order*. With ``symbols=True`` of the client every order is quantized
+            and checked before sending.
         Notes:
             ``POST /fapi/v1/batchOrders``
         See Also:
@@ -243,11 +241,13 @@ class Account:
                 }
             ]
         """
+        orders = self._to_api(batch_orders)
+        await self._prepare_orders(orders)
         return await self._fetch(
             'POST',
             'create_private_batch_order',
             '/fapi/v1/batchOrders',
-            batchOrders=ujson.dumps(self._to_api(batch_orders))
+            batchOrders=self.codec.dumps(orders)
         )
 
     async def get_private_order(self,
@@ -328,9 +328,9 @@ class Account:
             order_id_list: int list; max length 10 e.g. [1234567, 2345678] or string list; max length 10 e.g.
                                     ["my_id_1", "my_id_2"], encode the double quotes. No space after comma.
         """
-        params = {"symbol": symbol, "orderIdList": ujson.dumps(order_id_list)}\
+        params = {"symbol": symbol, "orderIdList": self.codec.dumps(order_id_list)}\
             if isinstance(order_id_list[0], int)\
-            else {"symbol": symbol, "origClientOrderIdList": ujson.dumps(order_id_list)}
+            else {"symbol": symbol, "origClientOrderIdList": self.codec.dumps(order_id_list)}
         return await self._fetch(
             'DELETE',
             'delete_private_batch_order',
@@ -414,7 +414,7 @@ class Account:
         """
         return await self._fetch(
             'GET',
-            'get_private_all_orders',
+            'get_private_all_open_orders',
             '/fapi/v1/openOrders',
             **kwargs
         )
@@ -566,7 +566,7 @@ class Account:
             'get_private_position_margin_history',
             '/fapi/v1/positionMargin/history',
             symbol=symbol,
-            **self._to_api(**kwargs)
+            **self._to_api(kwargs)
         )
 
     async def get_private_position_risk(self, symbol: str) -> dict:
@@ -1,3 +1,5 @@
+from aio_binance.futures.usdt.api.columnar import (decode_agg_trades, decode_depth,
+                                                   decode_funding_rate, decode_klines)
 
 
 class Market:
@@ -49,7 +51,8 @@ class Market:
 
     async def get_public_depth(self,
                                symbol: str,
-                               limit: int = 500) -> dict:
+                               limit: int = 500,
+                               columnar: bool = False) -> dict:
         """**Get Orderbook**
 
         Notes:
@@ -59,11 +62,14 @@ class Market:
         Args:
             symbol: the trading symbol.
             limit: Defaults 500, valid limits: [5, 10, 20, 50, 100, 500, 1000].
+            columnar: return bids and asks as (levels, 2) float64 numpy arrays decoded
+                straight from the response. Needs numpy. Default False
         """
         return await self._fetch(
             'GET',
             'get_public_depth',
             "/fapi/v1/depth",
+            decoder=decode_depth if columnar else None,
             symbol=symbol,
             limit=limit
         )
@@ -96,7 +102,7 @@ class Market:
         """**Old Trade Lookup**
             Get older market historical trades.
         Notes:
-            ``GET /fapi/v1/historicalTrades``
+            ``GET /fapi/v1/historicalTrades``, needs the API key of the client, the request is not signed
         See Also:
             https://binance-docs.github.io/apidocs/futures/en/#old-trades-lookup-market_data
         Args:
@@ -115,6 +121,7 @@ class Market:
 
     async def get_public_agg_trades(self,
                                     symbol: str,
+                                    columnar: bool = False,
                                     **kwargs) -> dict:
         """**Compressed/Aggregate Trades List**
             Get compressed, aggregate market trades.
@@ -127,6 +134,8 @@ class Market:
             https://binance-docs.github.io/apidocs/futures/en/#compressed-aggregate-trades-list
         Args:
             symbol: the trading symbol.
+            columnar: return a dict of numpy arrays decoded straight from the response
+                instead of a list of strings. Needs numpy. Default False
         Keyword Args:
             limit (Optional[int]): limit the results. default 500, max 1000.
             form_id (Optional[int]): ID to get aggregate trades from INCLUSIVE.
@@ -137,6 +146,7 @@ class Market:
             'GET',
             'get_public_agg_trades',
             "/fapi/v1/aggTrades",
+            decoder=decode_agg_trades if columnar else None,
             symbol=symbol,
             **self._to_api(kwargs)
         )
@@ -144,6 +154,7 @@ class Market:
     async def get_public_klines(self,
                                 symbol: str,
                                 interval: str,
+                                columnar: bool = False,
                                 **kwargs) -> dict:
         """**Kline/Candlestick Data**
             Kline/candlestick bars for a symbol. Klines are uniquely identified by their open time.
@@ -155,6 +166,8 @@ class Market:
         Args:
             symbol: the trading symbol.
             interval: the interval of kline, e.g. 1m, 5m, 1h, 1d, etc.
+            columnar: return a dict of numpy arrays decoded straight from the response
+                instead of a list of strings. Needs numpy. Default False
         Keyword Args:
             limit (Optional[int]): limit the results. async default 500, max 1000.
             start_time (Optional[int]): start time
@@ -164,6 +177,7 @@ class Market:
             'GET',
             'get_public_klines',
             "/fapi/v1/klines",
+            decoder=decode_klines if columnar else None,
             symbol=symbol,
             interval=interval,
             **self._to_api(kwargs)
@@ -173,6 +187,7 @@ class Market:
                                            symbol: str,
                                            contract_type: str,
                                            interval: str,
+                                           columnar: bool = False,
                                            **kwargs) -> dict:
         """**Continuous Kline/Candlestick Data**
             Kline/candlestick bars for a specific contract type.
@@ -186,6 +201,8 @@ class Market:
             symbol: the trading pair.
             contract_type: PERPETUAL, CURRENT_MONTH, NEXT_MONTH, CURRENT_QUARTER, NEXT_QUARTER.
             interval: the interval of kline, e.g. 1m, 5m, 1h, 1d, etc.
+            columnar: return a dict of numpy arrays decoded straight from the response
+                instead of a list of strings. Needs numpy. Default False
         Keyword Args:
             limit (Optional[int]): limit the results. async default 500, max 1000.
             start_time (Optional[int]): start time
@@ -196,6 +213,7 @@ class Market:
             'GET',
             'get_public_continuous_klines',
             "/fapi/v1/continuousKlines",
+            decoder=decode_klines if columnar else None,
             pair=symbol,
             contractType=contract_type,
             interval=interval,
@@ -205,6 +223,7 @@ class Market:
     async def get_public_index_price_klines(self,
                                             symbol: str,
                                             interval: str,
+                                            columnar: bool = False,
                                             **kwargs) -> dict:
         """**Kline/Candlestick Data for the index price of a pair.**
             Klines are uniquely identified by their open time.
@@ -217,6 +236,8 @@ class Market:
         Args:
             symbol: the trading pair.
             interval: the interval of kline, e.g. 1m, 5m, 1h, 1d, etc.
+            columnar: return a dict of numpy arrays decoded straight from the response
+                instead of a list of strings. Needs numpy. Default False
         Keyword Args:
             limit (Optional[int]): limit the results. async default 500, max 1000.
             start_time (Optional[int]): start time
@@ -226,6 +247,7 @@ class Market:
             'GET',
             'get_public_index_price_klines',
             "/fapi/v1/indexPriceKlines",
+            decoder=decode_klines if columnar else None,
             pair=symbol,
             interval=interval,
             **self._to_api(kwargs)
@@ -234,6 +256,7 @@ class Market:
     async def get_public_mark_price_klines(self,
                                            symbol: str,
                                            interval: str,
+                                           columnar: bool = False,
                                            **kwargs) -> dict:
         """**Kline/candlestick bars for the mark price of a symbol.**
             Klines are uniquely identified by their open time.
@@ -246,6 +269,8 @@ class Market:
         Args:
             symbol: the trading pair.
             interval: the interval of kline, e.g. 1m, 5m, 1h, 1d, etc.
+            columnar: return a dict of numpy arrays decoded straight from the response
+                instead of a list of strings. Needs numpy. Default False
         Keyword Args:
             limit (Optional[int]): limit the results. async default 500, max 1000.
             start_time (Optional[int]): start time
@@ -255,6 +280,7 @@ class Market:
             'GET',
             'get_public_mark_price_klines',
             "/fapi/v1/markPriceKlines",
+            decoder=decode_klines if columnar else None,
             symbol=symbol,
             interval=interval,
             **self._to_api(kwargs)
@@ -279,6 +305,7 @@ class Market:
 
     async def get_public_funding_rate(self,
                                       symbol: str,
+                                      columnar: bool = False,
                                       **kwargs) -> dict:
         """**Funding Rate History**
 
@@ -288,6 +315,8 @@ class Market:
             https://binance-docs.github.io/apidocs/futures/en/#get-funding-rate-history
         Args:
             symbol: the trading pair.
+            columnar: return a dict of numpy arrays decoded straight from the response
+                instead of a list of strings. Needs numpy. Default False
         Keyword Args:
             limit (Optional[int]): limit the results. async default 500, max 1000.
             start_time (Optional[int]): start time
@@ -302,6 +331,7 @@ class Market:
             'GET',
             'get_public_funding_rate',
             "/fapi/v1/fundingRate",
+            decoder=decode_funding_rate if columnar else None,
             symbol=symbol,
             **self._to_api(kwargs)
         )
@@ -0,0 +1,70 @@
+def snake_to_camel(snake_str: str) -> str:
+    components = snake_str.split('_')
+    return components[0] + ''.join(x.title() for x in components[1:])
+
+
+# Binance name of every documented keyword parameter, other keys are added on first use.
+PARAMS: dict[str, str] = {key: snake_to_camel(key) for key in (
+    'activation_price',
+    'auto_close_type',
+    'callback_rate',
+    'close_position',
+    'contract_type',
+    'count_down_time',
+    'dual_side_position',
+    'end_time',
+    'from_id',
+    'income_type',
+    'margin_type',
+    'multi_assets_margin',
+    'new_client_order_id',
+    'new_order_resp_type',
+    'order_id',
+    'orig_client_order_id',
+    'position_side',
+    'price_protect',
+    'recv_window',
+    'reduce_only',
+    'start_time',
+    'stop_price',
+    'time_in_force',
+    'working_type',
+)}
+
+
+def to_camel(key: str) -> str:
+    """**Binance name of a parameter**
+        camelCase and one-word keys are returned as they are.
+    """
+    if '_' not in key:
+        return key
+    camel = PARAMS.get(key)
+    if camel is None:
+        camel = PARAMS[key] = snake_to_camel(key)
+    return camel
+
+
+def to_api(params: dict) -> dict:
+    """**Parameters with Binance names**"""
+    translated = {}
+    for key, value in params.items():
+        if '_' in key:
+            key = PARAMS.get(key) or to_camel(key)
+        translated[key] = value
+    return translated
+
+
+def to_api_batch(items: list[dict]) -> list[dict]:
+    """**List of orders with Binance names**
+        Orders of one batch mostly have the same keys, the names are
+        looked up once per distinct set of keys.
+    """
+    translated = []
+    names = {}
+    for item in items:
+        keys = tuple(item)
+        camel = names.get(keys)
+        if camel is None:
+            camel = names[keys] = tuple(to_camel(key) for key in keys)
+        translated.append(dict(zip(camel, item.values())))
+    return translated
@@ -0,0 +1,119 @@
+import asyncio
+from typing import Iterable
+
+from aio_binance.futures.usdt.api.cache import ResponseCache
+from aio_binance.futures.usdt.api.clock import TimeSync
+from aio_binance.futures.usdt.api.limiter import IP_WEIGHT, RateLimiter, TokenBucket
+from aio_binance.futures.usdt.api.manager import FactoryApi
+from aio_binance.futures.usdt.api.scheduler import PriorityScheduler
+from aio_binance.futures.usdt.api.transport import Transport
+
+
+class Pool:
+    """**Clients of many accounts on one connection pool**
+        Every account has its own client with its own key, signing and order
+        rate limits. The connection pool, the IP weight, the scheduler, the
+        ban gate and the server clock are shared by all of them.
+
+    Args:
+        accounts: dict of name: (key, secret)
+    Keyword Args:
+        weight: (optional) TokenBucket() of the IP weight. Default shared by all clients
+        other keyword arguments of Client(), shared by every account
+    """
+
+    def __init__(self, accounts: dict[str, tuple[str, str]], **kwargs):
+        self.transport = Transport(session=kwargs.pop('session', None), **kwargs.pop('connector', {}))
+        self.weight: TokenBucket = kwargs.pop('weight', None) or IP_WEIGHT
+        kwargs['scheduler'] = kwargs.get('scheduler') or PriorityScheduler()
+        if kwargs.get('time_sync') is True:
+            kwargs['time_sync'] = TimeSync()
+        self.clock: TimeSync | None = kwargs['time_sync'] if isinstance(kwargs.get('time_sync'), TimeSync) else None
+        if kwargs.get('cache') is True:
+            # Private entries are kept per key.
+            kwargs['cache'] = ResponseCache()
+        kwargs.pop('limiter', None)
+        self._options = kwargs
+        self.clients: dict[str, FactoryApi] = {}
+        for name, (key, secret) in accounts.items():
+            self.add(name, key, secret)
+
+    def add(self, name: str, key: str, secret: str) -> FactoryApi:
+        """**Add an account to the pool**"""
+        client = FactoryApi(key=key,
+                            secret=secret,
+                            transport=self.transport,
+                            limiter=RateLimiter(weight=self.weight),
+                            own_clock=self.clock is None,
+                            **self._options)
+        self.clients[name] = client
+        return client
+
+    async def remove(self, name: str) -> None:
+        """**Remove an account from the pool, the shared clock and connection pool keep running**"""
+        await self.clients.pop(name).aclose()
+
+    def __getitem__(self, name: str) -> FactoryApi:
+        return self.clients[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.clients
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    @property
+    def names(self) -> list[str]:
+        return list(self.clients)
+
+    async def gather(self,
+                     method: str,
+                     *args,
+                     names: Iterable[str] = None,
+                     **kwargs) -> dict:
+        """**Call a method of every account concurrently**
+
+        Args:
+            method: name of the client method, e.g. 'get_private_balance'
+            args: arguments of the method
+            names: (optional) accounts to call. Default all
+            kwargs: keyword arguments of the method
+        Returns:
+            dict of name: result, or the exception raised for the account
+        Examples:
+            balances = await pool.gather('get_private_balance')
+        """
+        names = list(self.clients if names is None else names)
+        results = await asyncio.gather(
+            *(getattr(self.clients[name], method)(*args, **kwargs) for name in names),
+            return_exceptions=True)
+        return dict(zip(names, results))
+
+    @property
+    def pool_stats(self) -> dict:
+        """**Statistics of the shared connection pool**"""
+        return self.transport.stats
+
+    @property
+    def limiter_stats(self) -> dict:
+        """**Utilisation of the shared IP weight and of the order limits per account**"""
+        return {
+            'weight': self.weight.metrics,
+            'accounts': {name: {'orders_10s': client.limiter.orders_10s.metrics,
+                                'orders_1m': client.limiter.orders_1m.metrics}
+                         for name, client in self.clients.items()}
+        }
+
+    async def aclose(self) -> None:
+        """**Stop every client, the shared time sync and close the shared connection pool**"""
+        for client in self.clients.values():
+            await client.aclose()
+        if self.clock is not None:
+            await self.clock.stop()
+        await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
@@ -1,23 +1,58 @@
+import asyncio
 import hmac
-import time
-from copy import deepcopy
+import string
+from contextvars import ContextVar
 from hashlib import sha256
-from typing import Dict
-from urllib.parse import urlencode
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping
+from urllib.parse import quote_plus
 
-import ujson
-from aiohttp import ClientSession
+from aiohttp import ClientTimeout
 from loguru import logger
+from yarl import URL
 
 from aio_binance.__version__ import __version__
+from aio_binance.codec import Codec, get_codec
 from aio_binance.error_handler.error import BinanceException
+from aio_binance.futures.usdt.api.ban import BAN_GATE, BanGate
+from aio_binance.futures.usdt.api.cache import ResponseCache
+from aio_binance.futures.usdt.api.clock import TimeSync
+from aio_binance.futures.usdt.api.coalesce import Singleflight
+from aio_binance.futures.usdt.api.limiter import RateLimiter
+from aio_binance.futures.usdt.api.retry import RetryPolicy
+from aio_binance.futures.usdt.api.scheduler import PriorityScheduler
+from aio_binance.futures.usdt.api.symbols import SymbolIndex
 from aio_binance.timer import AioTimer
 
 
+# Characters that urlencode() leaves as they are.
+_SAFE = frozenset(string.ascii_letters + string.digits + '_.-~')
+
+# full: {'data': ..., 'limit_usage': ..., 'header': ...}, data: the decoded payload, raw: the body bytes.
+RESPONSE_MODES = ('full', 'data', 'raw')
+
+# MARKET_DATA methods, public but sent with the X-MBX-APIKEY header and without a signature.
+MARKET_DATA = frozenset(('get_public_historical_trades',))
+
+# Response mode forced by Client.response_mode() for the current task.
+RESPONSE: ContextVar[str | None] = ContextVar('response', default=None)
+
+
+def _urlencode(params: Dict) -> str:
+    """Same output as urlencode(), without quoting values that need none"""
+    parts = []
+    for key, value in params.items():
+        value = str(value)
+        if not _SAFE.issuperset(value):
+            value = quote_plus(value)
+        if not _SAFE.issuperset(key):
+            key = quote_plus(key)
+        parts.append(f"{key}={value}")
+    return '&'.join(parts)
+
+
 class Api:
 
-    SHIFT_SECONDS = 0
-    RECONNECT = 0
     WEIGHT = 0
 
     def __init__(self, **kwargs):
@@ -28,24 +63,44 @@ class Api:
         self.host = 'https://testnet.binancefuture.com' \
             if kwargs.get('testnet') \
             else 'https://fapi.binance.com'
-        self.session: ClientSession = None
         self.timeout = kwargs.get('timeout', 5)
-        self.__init_params(self.timeout)
+        self.retry: RetryPolicy = kwargs.get('retry') or RetryPolicy()
+        self.ban_gate: BanGate = kwargs.get('ban_gate') or BAN_GATE
+        self.limiter: RateLimiter = kwargs.get('limiter') or RateLimiter()
+        self.scheduler: PriorityScheduler = kwargs.get('scheduler') or PriorityScheduler()
+        self.singleflight: Singleflight = Singleflight() if kwargs.get('coalesce') else None
+        time_sync = kwargs.get('time_sync')
+        self.time_sync = bool(time_sync)
+        self.clock: TimeSync = time_sync if isinstance(time_sync, TimeSync) else TimeSync()
+        self.recv_window = kwargs.get('recv_window', 60000)
+        cache = kwargs.get('cache')
+        self.cache: ResponseCache = ResponseCache() if cache is True else cache or None
+        symbols = kwargs.get('symbols')
+        self.symbols: SymbolIndex = SymbolIndex() if symbols is True else symbols or None
+        self.codec: Codec = get_codec(kwargs.get('codec'))
+        self.response: str = kwargs.get('response', 'full')
+        assert self.response in RESPONSE_MODES, f"Response must be one of {RESPONSE_MODES}"
+        self.last_headers: Mapping = {}
         self.agent = kwargs.get('agent', 'aio-binance-library')
+        self.__headers = self.__build_headers()
+        self.__hmac = None
 
-    @classmethod
-    def __init_params(cls, timeout):
-        cls.HEADERS = {
-            "client_SDK_Version": f"aio-binance-library v{__version__}-py3.10"
-        }
-        cls.TIMEOUT = timeout
+    def __build_headers(self) -> Dict[tuple, Mapping]:
+        """Read-only header sets by (with API key, GET), shared by concurrent requests"""
+        headers = {}
+        for private in (False, True):
+            for get in (True, False):
+                _headers = {
+                    "client_SDK_Version": f"aio-binance-library v{__version__}-py3.10",
+                    "user-agent": self.agent,
+                    "Content-Type": "application/json" if get else "application/x-www-form-urlencoded"
+                }
+                if private and self.key:
+                    _headers["X-MBX-APIKEY"] = self.key
+                headers[private, get] = MappingProxyType(_headers)
+        return headers
 
-    @classmethod
-    def __set_shift_seconds(cls, seconds) -> None:
-        cls.SHIFT_SECONDS = seconds
-
-    @classmethod
-    async def __check_response(cls, json_wrapper: dict | list) -> None:
+    async def __check_response(self, json_wrapper: dict | list) -> None:
         code = 200
         msg = ""
         if isinstance(json_wrapper, list):
@@ -62,108 +117,133 @@ class Api:
                 msg = json_wrapper.get("msg", "")
         if code != 200:
             if code == -1021:
-                cls.__set_shift_seconds(cls.SHIFT_SECONDS - 1)
-            elif code == -1003:
-                start = msg.find(' ', msg.find('until'))
-                end = msg.find('.', start)
-                timer = int((int(msg[start:end - 1]) - int(time.time() * 100)) / 100)
-                logger.log('API', f"Binance banned IP. I'll be waiting {timer} sec.")
-                time.sleep(timer)
+                if self.time_sync:
+                    self.clock.resync(self)
+                else:
+                    self.clock.shift(-1000)
+            raise BinanceException(code, msg)
+
+    def __check_ban(self, response, json_wrapper: dict | list | None) -> None:
+        banned_until = self.ban_gate.parse(response.status, response.headers, json_wrapper)
+        if banned_until:
+            payload = json_wrapper if isinstance(json_wrapper, dict) else {}
+            code = payload.get('code', response.status)
+            msg = payload.get('msg', f"HTTP {response.status}")
+            self.ban_gate.ban(banned_until, code, msg)
             raise BinanceException(code, msg)
 
-    def __crypto_key(self, params: Dict) -> None:
+    def __crypto_key(self, params: Dict) -> str:
+        """Sign params, return the query string that is sent as is"""
         params.update({
-            'recvWindow': 60000,
-            'timestamp': int((time.time() + self.SHIFT_SECONDS - 1) * 1000)
+            'recvWindow': self.recv_window,
+            'timestamp': self.clock.timestamp()
         })
-        params_str = urlencode(params).encode('utf-8')
-        sign = hmac.new(
-            key=bytearray(self.secret, encoding='utf-8'),
-            msg=params_str,
-            digestmod=sha256
-        ).hexdigest()
-        params.update({'signature': str(sign)})
-
-    async def __reconnect(self, sleeping, err):
-        if self.RECONNECT > 10:
-            raise BinanceException(
-                500,
-                f"(Binance Futures Api) Sorry )-: My attempts to connect have dried up." +
-                f"More than 10. I exit | Exception {err}")
-        else:
-            self.TIMEOUT += 2
-            self.RECONNECT += 1
-            sleeping += self.RECONNECT
-            logger.warning(f"(Binance Futures Api) Unable to connect {self.host}," +
-                           f" I'll wait {sleeping} sec. and try again," +
-                           f" effort № {self.RECONNECT}")
-            time.sleep(sleeping)
-            return await self._fetch(*self._args, **self._kwargs_deep)
-
-    async def _fetch(self, *args, **kwargs) -> Dict:
-        result = {}
-        self._args = args
-        self._kwargs_deep = deepcopy(kwargs)
-        self.HEADERS.update({'user-agent': self.agent})
-        if 'private' in args[1]:
+        query = _urlencode(params)
+        if self.__hmac is None:
+            self.__hmac = hmac.new(self.secret.encode('utf-8'), digestmod=sha256)
+        sign = self.__hmac.copy()
+        sign.update(query.encode('utf-8'))
+        return f"{query}&signature={sign.hexdigest()}"
+
+    def __build_request(self, method: str, name: str, path: str, private: bool, params: Dict) -> Dict:
+        request_data = {
+            'method': method,
+            'url': self.host + path,
+            'headers': self.__headers[private or name in MARKET_DATA, method == 'GET']
+        }
+        if private:
+            # The signed query is the canonical encoding, aiohttp must not encode it again.
+            query = self.__crypto_key(dict(params))
+            if method == 'GET':
+                request_data['url'] = URL(f"{request_data['url']}?{query}", encoded=True)
+            else:
+                request_data['data'] = query
+        elif params:
+            request_data['params' if method == 'GET' else 'data'] = params
+        return request_data
+
+    async def _fetch(self, *args, decoder: Callable = None, **kwargs) -> Dict | list | bytes:
+        mode = RESPONSE.get() or self.response
+        if self.cache is not None and self.cache.ttl(args[1]):
+            # Private responses belong to the account of the key.
+            key = (args[1], self.key if 'private' in args[1] else None, decoder, mode,
+                   tuple(sorted(kwargs.items())))
+            return await self.cache.fetch(key, lambda: self.__coalesce(*args, decoder=decoder, mode=mode, **kwargs))
+        return await self.__coalesce(*args, decoder=decoder, mode=mode, **kwargs)
+
+    async def __coalesce(self, *args, decoder: Callable = None, mode: str = 'full', **kwargs) -> Dict | list | bytes:
+        if self.singleflight is not None and args[0] == 'GET' and 'private' not in args[1]:
+            key = (args[2], decoder, mode, tuple(sorted(kwargs.items())))
+            return await self.singleflight.do(
+                key, lambda: self.__request(*args, decoder=decoder, mode=mode, **kwargs))
+        return await self.__request(*args, decoder=decoder, mode=mode, **kwargs)
+
+    async def __request(self, *args, decoder: Callable = None, mode: str = 'full', **kwargs) -> Dict | list | bytes:
+        private = 'private' in args[1]
+        if private:
             assert self.key is not None, \
                 f"For job function {args[1]}() needs api key binance, please add in Client()"
             assert self.secret is not None, \
                 f"For job function {args[1]}() needs api secret binance, please add in Client()"
-            self.HEADERS.update({"X-MBX-APIKEY": self.key})
-            self.__crypto_key(kwargs)
-        else:
-            self.HEADERS.pop("X-MBX-APIKEY", None)
-        url = self.host + args[2]
-        request_data = {
-            'method': args[0],
-            'url': url,
-            'timeout': self.TIMEOUT
-        }
-        if args[0] == 'GET':
-            self.HEADERS.update({'Content-Type': 'application/json'})
-            request_data['params'] = kwargs if kwargs.keys() else None
-        else:
-            self.HEADERS.update({'Content-Type': 'application/x-www-form-urlencoded'})
-            request_data['data'] = kwargs if kwargs.keys() else None
-        request_data['headers'] = self.HEADERS
-        try:
-            async with AioTimer(name=f'Binance Futures Api request {args[2]}'):
-                if self.session:
-                    async with self.session.request(**request_data) as response:
-                        _response = await response.text()
+            if self.time_sync and not self.clock.running:
+                self.clock.start(self)
+        cost = self.limiter.cost(args[1], kwargs)
+        priority = self.scheduler.classify(args[1], kwargs)
+        retry = self.retry.start()
+        async with self.scheduler.slot(priority, cost[0], self.limiter.weight):
+            # The scheduler took the weight of the first attempt, retries pay it again.
+            pending = (0, *cost[1:])
+            while True:
+                await self.ban_gate.wait()
+                await self.limiter.acquire(pending)
+                pending = cost
+                # Signed after waiting in the queues, so the timestamp is fresh.
+                request_data = self.__build_request(args[0], args[1], args[2], private, kwargs)
+                # Every attempt waits a little longer for the server, only within this call.
+                request_data['timeout'] = ClientTimeout(total=self.timeout + 2 * retry.attempt)
+                try:
+                    async with AioTimer(name=f'Binance Futures Api request {args[2]}'):
+                        async with self.transport.request(**request_data) as response:
+                            _response = await response.read()
+                    self.limiter.update(response.headers)
+                    weight = response.headers.get('X-MBX-USED-WEIGHT-1M', '0')
+                    if int(weight) == 0:
+                        weight = response.headers.get('X-MBX-ORDER-COUNT-1M', '0')
+                    self.WEIGHT = weight
+                    self.last_headers = response.headers
+                except Exception as err:
+                    if private:
+                        raise BinanceException(-8888, err)
+                    sleeping = retry.next_delay(err)
+                    logger.warning(f"(Binance Futures Api) Unable to connect {self.host}," +
+                                   f" I'll wait {sleeping:0.2f} sec. and try again," +
+                                   f" effort № {retry.attempt}")
+                    await asyncio.sleep(sleeping)
                 else:
-                    async with ClientSession() as session:
-                        async with session.request(**request_data) as response:
-                            _response = await response.text()
-            self.WEIGHT = response.headers['X-MBX-USED-WEIGHT-1M']\
-                if int(response.headers['X-MBX-USED-WEIGHT-1M']) > 0\
-                else response.headers['X-MBX-ORDER-COUNT-1M']
-        except Exception as err:
-            if 'private' in args[1]:
-                raise BinanceException(-8888, err)
+                    break
+        # Formatted by loguru only when the API level is enabled.
+        logger.log('API', "      Request {}() Worked well!. Limit usage: {}", args[1], weight)
+        if mode == 'raw' and response.status == 200:
+            return _response
+        try:
+            if decoder is not None and response.status == 200:
+                # Errors keep the plain JSON form for the checks below.
+                res_json = decoder(_response)
             else:
-                return await self.__reconnect(5, err)
+                res_json = self.codec.loads(_response)
+        except ValueError:
+            self.__check_ban(response, None)
+            raise BinanceException(
+                -1,
+                f"(Binance Futures Api) [Json Value Error] response: {_response.decode(errors='replace')}")
         else:
-            if self.RECONNECT > 0:
-                self.RECONNECT = 0
-                self.TIMEOUT = self.timeout
-            logger.log(
-                'API',
-                "      Request {}() Worked well!. Limit usage: {}".format(
-                    args[1],
-                    self.WEIGHT))
-            try:
-                res_json = ujson.loads(_response)
-            except ValueError:
-                raise BinanceException(
-                    -1,
-                    f"(Binance Futures Api) [Json Value Error] response: {_response}")
-            else:
-                await self.__check_response(res_json)
-                result['data'] = res_json
-                if self.show_limit_usage:
-                    result['limit_usage'] = self.WEIGHT
-                if self.show_header:
-                    result['header'] = response.headers
-                return result
+            self.__check_ban(response, res_json)
+            await self.__check_response(res_json)
+            if mode == 'data':
+                return res_json
+            result = {'data': res_json}
+            if self.show_limit_usage:
+                result['limit_usage'] = weight
+            if self.show_header:
+                result['header'] = response.headers
+            return result
@@ -0,0 +1,88 @@
+import asyncio
+import random
+import time
+
+from aiohttp import ClientError
+
+from aio_binance.error_handler.error import BinanceException
+
+
+class RetryPolicy:
+    """**Retry policy of public requests**
+        Exponential backoff with full jitter. The policy holds only settings,
+        the state of a retry lives in the call that is retried, so one flaky
+        request never slows down the others.
+
+    Args:
+        max_attempts: how many times a request is sent before giving up. Default 10
+        backoff: base delay in seconds, doubled on every attempt. Default 0.5
+        max_backoff: upper bound of one delay in seconds. Default 15
+        deadline: overall time budget in seconds for all attempts. Default 60
+        retry_on: exception classes worth a retry.
+            Default (aiohttp.ClientError, asyncio.TimeoutError, OSError)
+        jitter: randomize delays to spread retries of many clients. Default True
+    """
+
+    def __init__(self,
+                 max_attempts: int = 10,
+                 backoff: float = 0.5,
+                 max_backoff: float = 15,
+                 deadline: float = 60,
+                 retry_on: tuple = (ClientError, asyncio.TimeoutError, OSError),
+                 jitter: bool = True):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retry_on = retry_on
+        self.jitter = jitter
+
+    def retryable(self, err: Exception) -> bool:
+        return isinstance(err, self.retry_on)
+
+    def delay(self, attempt: int) -> float:
+        """**Delay before the next attempt**
+
+        Args:
+            attempt: number of attempts already made, starting from 1.
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def start(self) -> "RetryState":
+        """**Begin a new retry sequence for one call**"""
+        return RetryState(self)
+
+
+class RetryState:
+    """**Retry state of one call**"""
+
+    __slots__ = ('policy', 'attempt', 'started')
+
+    def __init__(self, policy: RetryPolicy):
+        self.policy = policy
+        self.attempt = 0
+        self.started = time.monotonic()
+
+    def next_delay(self, err: Exception) -> float:
+        """**Delay before the next attempt**
+            Raise BinanceException when the error is not retryable,
+            the attempts are over or the deadline would be passed.
+        """
+        self.attempt += 1
+        policy = self.policy
+        if not policy.retryable(err):
+            raise BinanceException(-8888, err)
+        if self.attempt >= policy.max_attempts:
+            raise BinanceException(
+                500,
+                f"(Binance Futures Api) Sorry )-: My attempts to connect have dried up." +
+                f" More than {policy.max_attempts}. I exit | Exception {err}")
+        delay = policy.delay(self.attempt)
+        if time.monotonic() - self.started + delay > policy.deadline:
+            raise BinanceException(
+                500,
+                f"(Binance Futures Api) Retry deadline {policy.deadline} sec. exceeded | Exception {err}")
+        return delay
@@ -0,0 +1,159 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from aio_binance.futures.usdt.api.limiter import TokenBucket
+
+# Classes of requests from the most to the least urgent.
+PRIORITIES = ('trade', 'account', 'market', 'backfill')
+
+# Priority class forced by Client.priority() for the current task.
+PRIORITY: ContextVar[str | None] = ContextVar('priority', default=None)
+
+TRADE_METHODS = frozenset((
+    'create_private_order',
+    'create_private_order_test',
+    'create_private_batch_order',
+    'delete_private_order',
+    'delete_private_batch_order',
+    'delete_private_all_open_orders',
+    'delete_private_order_countdown',
+))
+
+HISTORY_PARAMS = ('startTime', 'endTime', 'fromId')
+
+
+class PriorityScheduler:
+    """**Priority dispatch of requests**
+        Requests of one class are sent in arrival order, classes are served
+        from ``trade`` to ``backfill``. Each class may run a limited number of
+        requests at once, and every class except ``trade`` leaves a share of
+        the IP weight untouched, so orders and cancels always find weight left.
+
+    Args:
+        limits: (optional) dict of concurrent requests per class, None is unlimited.
+            Default {'trade': None, 'account': 20, 'market': 20, 'backfill': 5}
+        reserve: (optional) dict of the weight share per class that must stay free
+            after the request. Default {'trade': 0, 'account': 0.05, 'market': 0.1, 'backfill': 0.3}
+    """
+
+    def __init__(self, limits: dict = None, reserve: dict = None):
+        self.limits = {'trade': None, 'account': 20, 'market': 20, 'backfill': 5}
+        self.limits.update(limits or {})
+        self.reserve = {'trade': 0, 'account': 0.05, 'market': 0.1, 'backfill': 0.3}
+        self.reserve.update(reserve or {})
+        self._waiters = {name: deque() for name in PRIORITIES}
+        self._running = dict.fromkeys(PRIORITIES, 0)
+        self._stats = {
+            name: {'dispatched': 0, 'wait_time': 0.0, 'max_wait': 0.0}
+            for name in PRIORITIES
+        }
+        self._timer: asyncio.TimerHandle = None
+
+    @staticmethod
+    def classify(name: str, params: dict) -> str:
+        """**Priority class of a request**"""
+        forced = PRIORITY.get()
+        if forced is not None:
+            return forced
+        if name in TRADE_METHODS:
+            return 'trade'
+        if 'private' in name:
+            return 'account'
+        if any(key in params for key in HISTORY_PARAMS):
+            return 'backfill'
+        return 'market'
+
+    def _admissible(self, name: str, weight: int, bucket: TokenBucket) -> float:
+        """Return 0 when the request may go, else seconds until the weight allows it"""
+        limit = self.limits[name]
+        if limit is not None and self._running[name] >= limit:
+            return -1
+        reserve = self.reserve[name] * bucket.capacity
+        if not reserve:
+            return 0
+        missing = weight + reserve - bucket.available
+        return missing / bucket.rate if missing > 0 else 0
+
+    def _pump(self) -> None:
+        self._timer = None
+        wake_up = None
+        for name in PRIORITIES:
+            waiters = self._waiters[name]
+            while waiters:
+                future, weight, bucket = waiters[0]
+                if future.done():
+                    waiters.popleft()
+                    continue
+                delay = self._admissible(name, weight, bucket)
+                if delay:
+                    if delay > 0:
+                        wake_up = delay if wake_up is None else min(wake_up, delay)
+                    break
+                waiters.popleft()
+                self._running[name] += 1
+                # The weight is taken on admission, the next waiter sees the balance it leaves.
+                future.set_result(bucket.reserve(weight))
+        if wake_up is not None:
+            self._timer = asyncio.get_running_loop().call_later(wake_up, self._pump)
+
+    @asynccontextmanager
+    async def slot(self, name: str, weight: int, bucket: TokenBucket):
+        """**Wait for the turn of a request and hold its slot while it runs**
+            The weight of the request is taken from the bucket when it is
+            admitted, the request must not acquire it again.
+
+        Args:
+            name: priority class
+            weight: weight of the request
+            bucket: TokenBucket of the IP weight
+        """
+        started = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[name].append((future, weight, bucket))
+        if self._timer is not None:
+            self._timer.cancel()
+        self._pump()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                bucket.release(weight)
+                self._running[name] -= 1
+                self._pump()
+            raise
+        try:
+            await bucket.settle(weight, future.result())
+        except asyncio.CancelledError:
+            self._running[name] -= 1
+            self._pump()
+            raise
+        waited = time.monotonic() - started
+        stats = self._stats[name]
+        stats['dispatched'] += 1
+        stats['wait_time'] += waited
+        stats['max_wait'] = max(stats['max_wait'], waited)
+        try:
+            yield
+        finally:
+            self._running[name] -= 1
+            if self._timer is not None:
+                self._timer.cancel()
+            self._pump()
+
+    @property
+    def metrics(self) -> dict:
+        """**Queue depth, running requests and wait time per class**"""
+        metrics = {}
+        for name in PRIORITIES:
+            stats = self._stats[name]
+            metrics[name] = {
+                'queued': sum(not future.done() for future, _, _ in self._waiters[name]),
+                'running': self._running[name],
+                'dispatched': stats['dispatched'],
+                'avg_wait': round(stats['wait_time'] / stats['dispatched'], 4) if stats['dispatched'] else 0.0,
+                'max_wait': round(stats['max_wait'], 4)
+            }
+        return metrics
@@ -0,0 +1,238 @@
+import time
+from decimal import ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_UP, Decimal
+
+from aio_binance.error_handler.error import BinanceException
+from aio_binance.futures.usdt.api.columnar import np, require_numpy
+
+ROUNDING = {
+    'nearest': ROUND_HALF_UP,
+    'down': ROUND_FLOOR,
+    'up': ROUND_CEILING,
+}
+
+# Margin against float error of a division, e.g. 0.3 / 0.1 = 2.9999999999999996.
+_EPSILON = 1e-9
+
+
+def _is_true(value) -> bool:
+    return value is True or str(value).lower() == 'true'
+
+
+def _decimals(step: Decimal) -> int:
+    return max(0, -step.normalize().as_tuple().exponent)
+
+
+class SymbolFilters:
+    """**Trading rules of one symbol from exchange info**
+
+    Args:
+        info: item of ``symbols`` of ``get_public_exchange_info()``
+    """
+
+    __slots__ = ('symbol', 'status', 'tick_size', 'min_price', 'max_price',
+                 'step_size', 'min_qty', 'max_qty', 'market_step_size', 'market_min_qty', 'market_max_qty',
+                 'min_notional', 'max_orders', 'max_algo_orders', 'price_precision', 'quantity_precision',
+                 'price_decimals', 'quantity_decimals', 'market_quantity_decimals')
+
+    def __init__(self, info: dict):
+        filters = {item['filterType']: item for item in info.get('filters', ())}
+        price = filters.get('PRICE_FILTER', {})
+        lot = filters.get('LOT_SIZE', {})
+        market_lot = filters.get('MARKET_LOT_SIZE', lot)
+        self.symbol: str = info['symbol']
+        self.status: str = info.get('status', 'TRADING')
+        self.tick_size = Decimal(price.get('tickSize', '0'))
+        self.min_price = Decimal(price.get('minPrice', '0'))
+        self.max_price = Decimal(price.get('maxPrice', '0'))
+        self.step_size = Decimal(lot.get('stepSize', '0'))
+        self.min_qty = Decimal(lot.get('minQty', '0'))
+        self.max_qty = Decimal(lot.get('maxQty', '0'))
+        self.market_step_size = Decimal(market_lot.get('stepSize', '0'))
+        self.market_min_qty = Decimal(market_lot.get('minQty', '0'))
+        self.market_max_qty = Decimal(market_lot.get('maxQty', '0'))
+        self.min_notional = Decimal(filters.get('MIN_NOTIONAL', {}).get('notional', '0'))
+        self.max_orders: int | None = filters.get('MAX_NUM_ORDERS', {}).get('limit')
+        self.max_algo_orders: int | None = filters.get('MAX_NUM_ALGO_ORDERS', {}).get('limit')
+        self.price_precision: int | None = info.get('pricePrecision')
+        self.quantity_precision: int | None = info.get('quantityPrecision')
+        self.price_decimals = _decimals(self.tick_size)
+        self.quantity_decimals = _decimals(self.step_size)
+        self.market_quantity_decimals = _decimals(self.market_step_size)
+
+    def __repr__(self) -> str:
+        return f"SymbolFilters({self.symbol!r}, tick_size={self.tick_size}, step_size={self.step_size})"
+
+    @staticmethod
+    def __round(value, step: Decimal, decimals: int, rounding: str) -> str:
+        value = Decimal(str(value))
+        if step:
+            value = (value / step).to_integral_value(ROUNDING[rounding]) * step
+        return f"{value:.{decimals}f}"
+
+    def quantize_price(self, price: float | str, rounding: str = 'nearest') -> str:
+        """**Price on the tick size as a string**
+
+        Args:
+            price: the price
+            rounding: 'nearest', 'down' or 'up'. Default 'nearest'
+        """
+        return self.__round(price, self.tick_size, self.price_decimals, rounding)
+
+    def quantize_quantity(self, quantity: float | str, market: bool = False) -> str:
+        """**Quantity rounded down on the step size as a string**
+
+        Args:
+            quantity: the quantity
+            market: use the step size of market orders. Default False
+        """
+        if market:
+            return self.__round(quantity, self.market_step_size, self.market_quantity_decimals, 'down')
+        return self.__round(quantity, self.step_size, self.quantity_decimals, 'down')
+
+    def check(self,
+              price: str | None,
+              quantity: str | None,
+              market: bool = False,
+              reduce_only: bool = False) -> None:
+        """**Raise BinanceException if the order breaks a filter**
+
+        Args:
+            price: quantized price or None
+            quantity: quantized quantity or None
+            market: check the quantity limits of market orders. Default False
+            reduce_only: the order only reduces a position, Binance does not apply MIN_NOTIONAL. Default False
+        """
+        if price is not None:
+            price = Decimal(price)
+            if price < self.min_price or (self.max_price and price > self.max_price):
+                raise BinanceException(
+                    -1013, f"Price {price} of {self.symbol} is out of [{self.min_price}, {self.max_price}]")
+        if quantity is not None:
+            quantity = Decimal(quantity)
+            min_qty, max_qty = (self.market_min_qty, self.market_max_qty) if market else (self.min_qty, self.max_qty)
+            if quantity < min_qty or (max_qty and quantity > max_qty):
+                raise BinanceException(
+                    -1013, f"Quantity {quantity} of {self.symbol} is out of [{min_qty}, {max_qty}]")
+            if price is not None and not reduce_only and price * quantity < self.min_notional:
+                raise BinanceException(
+                    -4164, f"Notional {price * quantity} of {self.symbol} is smaller than {self.min_notional}")
+
+    def quantize_prices(self, prices, rounding: str = 'nearest'):
+        """**Prices on the tick size, vectorised**
+
+        Args:
+            prices: array-like of prices
+            rounding: 'nearest', 'down' or 'up'. Default 'nearest'
+        Returns:
+            float64 numpy array
+        """
+        require_numpy()
+        prices = np.asarray(prices, dtype='float64')
+        if not self.tick_size:
+            return prices
+        tick = float(self.tick_size)
+        steps = prices / tick
+        if rounding == 'nearest':
+            steps = np.floor(steps + 0.5 + _EPSILON)
+        elif rounding == 'down':
+            steps = np.floor(steps + _EPSILON)
+        else:
+            steps = np.ceil(steps - _EPSILON)
+        return np.round(steps * tick, self.price_decimals)
+
+    def quantize_quantities(self, quantities, market: bool = False):
+        """**Quantities rounded down on the step size, vectorised**
+
+        Args:
+            quantities: array-like of quantities
+            market: use the step size of market orders. Default False
+        Returns:
+            float64 numpy array
+        """
+        require_numpy()
+        quantities = np.asarray(quantities, dtype='float64')
+        step, decimals = (self.market_step_size, self.market_quantity_decimals) if market \
+            else (self.step_size, self.quantity_decimals)
+        if not step:
+            return quantities
+        step = float(step)
+        return np.round(np.floor(quantities / step + _EPSILON) * step, decimals)
+
+    def validate(self, prices, quantities, market: bool = False, reduce_only: bool = False):
+        """**Mask of the orders that pass the price, quantity and notional filters, vectorised**
+
+        Args:
+            prices: array-like of quantized prices
+            quantities: array-like of quantized quantities
+            market: check the quantity limits of market orders. Default False
+            reduce_only: the orders only reduce a position, the notional is not checked. Default False
+        Returns:
+            bool numpy array
+        """
+        require_numpy()
+        prices = np.asarray(prices, dtype='float64')
+        quantities = np.asarray(quantities, dtype='float64')
+        min_qty, max_qty = (self.market_min_qty, self.market_max_qty) if market else (self.min_qty, self.max_qty)
+        valid = (prices >= float(self.min_price)) & (quantities >= float(min_qty) - _EPSILON)
+        if self.max_price:
+            valid &= prices <= float(self.max_price)
+        if max_qty:
+            valid &= quantities <= float(max_qty) + _EPSILON
+        if reduce_only:
+            return valid
+        return valid & (prices * quantities >= float(self.min_notional) - _EPSILON)
+
+    def prepare(self, order: dict) -> dict:
+        """**Quantize and check an order with Binance parameter names**
+            price, stopPrice and activationPrice go on the tick size, quantity is rounded down
+            on the step size. Reduce only and close position orders are exempt from MIN_NOTIONAL,
+            as on Binance.
+
+        Args:
+            order: parameters of the order, they are changed in place
+        Raises:
+            BinanceException: the order breaks a filter
+        """
+        market = order.get('type') in ('MARKET', 'STOP_MARKET', 'TAKE_PROFIT_MARKET')
+        for key in ('price', 'stopPrice', 'activationPrice'):
+            if order.get(key) is not None:
+                order[key] = self.quantize_price(order[key])
+        if order.get('quantity') is not None:
+            order['quantity'] = self.quantize_quantity(order['quantity'], market)
+        reduce_only = _is_true(order.get('reduceOnly')) or _is_true(order.get('closePosition'))
+        self.check(order.get('price'), order.get('quantity'), market, reduce_only)
+        return order
+
+
+class SymbolIndex:
+    """**Trading rules of all symbols by name**
+        Built from ``get_public_exchange_info()``, see ``Client.load_symbols()``.
+    """
+
+    def __init__(self):
+        self._symbols: dict[str, SymbolFilters] = {}
+        self.loaded_at: float | None = None
+
+    def load(self, exchange_info: dict) -> None:
+        """**Replace the rules with the symbols of exchange info**"""
+        self._symbols = {info['symbol']: SymbolFilters(info) for info in exchange_info['symbols']}
+        self.loaded_at = time.time()
+
+    def __getitem__(self, symbol: str) -> SymbolFilters:
+        filters = self._symbols.get(symbol)
+        if filters is None:
+            raise BinanceException(-1121, f"Invalid symbol {symbol}")
+        return filters
+
+    def get(self, symbol: str) -> SymbolFilters | None:
+        return self._symbols.get(symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._symbols
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def prepare(self, order: dict) -> dict:
+        """**Quantize and check an order with Binance parameter names, see SymbolFilters.prepare()**"""
+        return self[order['symbol']].prepare(order)
@@ -0,0 +1,141 @@
+import asyncio
+import ssl
+from contextlib import asynccontextmanager
+
+from aiohttp import ClientSession, TCPConnector, TraceConfig
+from loguru import logger
+
+
+class Transport:
+    """**Pooled HTTP transport**
+        Owns one ``aiohttp.ClientSession`` that is created lazily on the first request
+        and reused by every following request, so TCP and TLS handshakes are paid once
+        per connection instead of once per call.
+
+    Args:
+        session: (optional) external aiohttp.ClientSession(). It is used as is
+            and is never closed by the transport.
+    Keyword Args:
+        limit (int): total number of simultaneous connections. Default 100
+        limit_per_host (int): simultaneous connections to one host. Default 20
+        keepalive_timeout (float): seconds an idle connection is kept open. Default 30
+        ttl_dns_cache (int): seconds a resolved address is cached. Default 300
+    """
+
+    def __init__(self, session: ClientSession = None, **kwargs):
+        self._external = session
+        self._session: ClientSession = None
+        self._closed = False
+        self.limit = kwargs.get('limit', 100)
+        self.limit_per_host = kwargs.get('limit_per_host', 20)
+        self.keepalive_timeout = kwargs.get('keepalive_timeout', 30)
+        self.ttl_dns_cache = kwargs.get('ttl_dns_cache', 300)
+        self._ssl_context: ssl.SSLContext = None
+        self._stats = {
+            'requests': 0,
+            'in_flight': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'connections_queued': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0
+        }
+
+    @property
+    def closed(self) -> bool:
+        session = self._external or self._session
+        return self._closed or session is None or session.closed
+
+    @property
+    def stats(self) -> dict:
+        """**Connection pool statistics**
+
+        Notes:
+            ``connections_created`` and ``connections_reused`` are only counted
+            for the session created by the transport itself.
+        """
+        stats = dict(self._stats)
+        session = self._external or self._session
+        connector = session.connector if session is not None else None
+        stats['limit'] = connector.limit if connector else self.limit
+        stats['limit_per_host'] = connector.limit_per_host if connector else self.limit_per_host
+        return stats
+
+    def _create_trace_config(self) -> TraceConfig:
+        trace = TraceConfig()
+
+        async def created(*_):
+            self._stats['connections_created'] += 1
+
+        async def reused(*_):
+            self._stats['connections_reused'] += 1
+
+        async def queued(*_):
+            self._stats['connections_queued'] += 1
+
+        async def dns_hit(*_):
+            self._stats['dns_cache_hits'] += 1
+
+        async def dns_miss(*_):
+            self._stats['dns_cache_misses'] += 1
+
+        trace.on_connection_create_end.append(created)
+        trace.on_connection_reuseconn.append(reused)
+        trace.on_connection_queued_start.append(queued)
+        trace.on_dns_cache_hit.append(dns_hit)
+        trace.on_dns_cache_miss.append(dns_miss)
+        return trace
+
+    def _create_session(self) -> ClientSession:
+        if self._ssl_context is None:
+            # One context for every connection, CA certificates are loaded once.
+            self._ssl_context = ssl.create_default_context()
+        connector = TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=True,
+            ssl=self._ssl_context
+        )
+        logger.log('API', f"      Open connection pool: limit {self.limit}, per host {self.limit_per_host}")
+        return ClientSession(connector=connector,
+                             trace_configs=[self._create_trace_config()])
+
+    def session(self) -> ClientSession:
+        """**Return the shared session, creating it on first use**
+
+        Raises:
+            RuntimeError: the transport has been closed with aclose()
+        """
+        if self._closed:
+            raise RuntimeError('Transport is closed')
+        if self._external is not None:
+            return self._external
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    @asynccontextmanager
+    async def request(self, **kwargs):
+        """**Send a request through the pool**
+
+        Keyword Args:
+            arguments of aiohttp.ClientSession.request()
+        """
+        self._stats['requests'] += 1
+        self._stats['in_flight'] += 1
+        try:
+            async with self.session().request(**kwargs) as response:
+                yield response
+        finally:
+            self._stats['in_flight'] -= 1
+
+    async def aclose(self) -> None:
+        """**Close the owned session and every pooled connection, the transport is not used again**"""
+        self._closed = True
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            # Give SSL transports a moment to shut down cleanly.
+            await asyncio.sleep(0.1)
+        self._session = None
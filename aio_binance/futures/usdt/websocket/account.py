@@ -1,5 +1,6 @@
 import asyncio
 
+from aio_binance.codec import Codec
 from aio_binance.futures.usdt import Client, WsClient
 from loguru import logger
 
@@ -13,6 +14,7 @@ class UserSession:
         key: Binance Api key.
         secret: Binance Api secret.
         debug: info, debug, error. Default: debug
+        codec: (optional) JSON backend 'ujson', 'orjson', 'json' or Codec(). Default 'ujson'
     Notes:
         - A User Data Stream listenKey is valid for 60 minutes after creation.
             This script will update it automatically
@@ -70,10 +72,12 @@ class UserSession:
     def __init__(self,
                  key: str,
                  secret: str,
-                 debug: str = 'debug'):
+                 debug: str = 'debug',
+                 codec: str | Codec = None):
         self.listen_key = None
-        self.__api = Client(key, secret, debug=debug)
+        self.__api = Client(key, secret, debug=debug, codec=codec)
         self.__debug = debug
+        self.__codec = codec
 
     async def __aenter__(self):
         res = await self.__api.create_private_listen_key()
@@ -84,6 +88,7 @@ class UserSession:
     async def __aexit__(self, exc_type, exc, tb):
         logger.log("ACCOUNT", '  Close User Session')
         await self.__api.delete_private_listen_key()
+        await self.__api.aclose()
         await asyncio.sleep(0.3)
 
     async def __update_key(self):
@@ -111,7 +116,8 @@ class UserSession:
         done, _ = await asyncio.wait(
             [
                 WsClient(self.listen_key,
-                         debug=self.__debug).stream_user_data(callback_event),
+                         debug=self.__debug,
+                         codec=self.__codec).stream_user_data(callback_event),
                 self.__update_key()
             ],
             return_when=asyncio.FIRST_COMPLETED
@@ -0,0 +1,302 @@
+import asyncio
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
+from loguru import logger
+
+from aio_binance.futures.usdt.websocket.events import DepthUpdate
+
+
+class BookSide:
+    """**Price levels of one side of an order book**
+        Levels are kept in two parallel lists sorted from the best price,
+        a level is found by binary search. Bids are stored with negated
+        prices so both sides sort ascending.
+
+    Args:
+        descending: True for bids, the best price is the highest
+    """
+
+    __slots__ = ('_keys', '_quantities', '_sign')
+
+    def __init__(self, descending: bool = False):
+        self._sign = -1.0 if descending else 1.0
+        self._keys: list[float] = []
+        self._quantities: list[float] = []
+
+    def load(self, levels: list) -> None:
+        """**Replace the levels with [price, quantity] pairs of a snapshot**"""
+        sign = self._sign
+        pairs = sorted((float(price) * sign, float(quantity)) for price, quantity in levels)
+        self._keys = [key for key, quantity in pairs if quantity]
+        self._quantities = [quantity for _, quantity in pairs if quantity]
+
+    def update(self, price: float, quantity: float) -> None:
+        """**Set the quantity of a price level, 0 removes it**"""
+        keys = self._keys
+        key = price * self._sign
+        index = bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            if quantity:
+                self._quantities[index] = quantity
+            else:
+                del keys[index]
+                del self._quantities[index]
+        elif quantity:
+            keys.insert(index, key)
+            self._quantities.insert(index, quantity)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, index: int) -> tuple[float, float]:
+        """**Level by rank, 0 is the best**"""
+        return self._keys[index] * self._sign, self._quantities[index]
+
+    @property
+    def best(self) -> tuple[float, float] | None:
+        """**Best (price, quantity) or None if the side is empty**"""
+        if not self._keys:
+            return None
+        return self._keys[0] * self._sign, self._quantities[0]
+
+    def top(self, depth: int) -> list[tuple[float, float]]:
+        """**Best levels as (price, quantity)**"""
+        sign = self._sign
+        return [(key * sign, quantity) for key, quantity in zip(islice(self._keys, depth), self._quantities)]
+
+    def quantity_to(self, price: float) -> float:
+        """**Cumulative quantity of the levels at the price or better**"""
+        return sum(islice(self._quantities, bisect_right(self._keys, price * self._sign)))
+
+    def price_for(self, quantity: float) -> float | None:
+        """**Worst price reached when the quantity is filled from the best level, None if the side is too thin**"""
+        for key, level in zip(self._keys, self._quantities):
+            quantity -= level
+            if quantity <= 0:
+                return key * self._sign
+        return None
+
+
+class OrderBook:
+    """**Local order book of one symbol**
+        Synchronised from a depth snapshot and the diff depth stream:
+        events older than the snapshot are dropped, the first applied event
+        must contain the ``lastUpdateId`` of the snapshot and every next one
+        must continue the previous (``pu`` equals the last ``u``).
+
+    Args:
+        symbol: the trading symbol.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide()
+        self.last_update_id: int | None = None
+        self.event_time: int | None = None
+        self.transaction_time: int | None = None
+        self.synced = False
+        self.updates = 0
+        self.resyncs = 0
+
+    def load_snapshot(self, snapshot: dict) -> None:
+        """**Replace the book with the response of get_public_depth()**"""
+        self.bids.load(snapshot['bids'])
+        self.asks.load(snapshot['asks'])
+        self.last_update_id = snapshot['lastUpdateId']
+        self.event_time = snapshot.get('E')
+        self.transaction_time = snapshot.get('T')
+        self.synced = False
+
+    def apply(self, event: dict | DepthUpdate) -> bool:
+        """**Apply a depthUpdate event, as decoded or typed**
+
+        Returns:
+            False if the event does not continue the book, it needs a new snapshot
+        """
+        if self.last_update_id is None:
+            return False
+        if isinstance(event, DepthUpdate):
+            first_id, last_id, previous_id = event.first_id, event.last_id, event.previous_id
+        else:
+            first_id, last_id, previous_id = event['U'], event['u'], event['pu']
+        if not self.synced:
+            if last_id < self.last_update_id:
+                return True
+            if first_id > self.last_update_id:
+                return False
+            self.synced = True
+        elif previous_id != self.last_update_id:
+            self.synced = False
+            return False
+        if isinstance(event, DepthUpdate):
+            bids, asks = event.bids, event.asks
+            self.event_time = event.event_time
+            self.transaction_time = event.transaction_time
+        else:
+            bids, asks = event['b'], event['a']
+            self.event_time = event['E']
+            self.transaction_time = event['T']
+        update = self.bids.update
+        for price, quantity in bids:
+            update(float(price), float(quantity))
+        update = self.asks.update
+        for price, quantity in asks:
+            update(float(price), float(quantity))
+        self.last_update_id = last_id
+        self.updates += 1
+        return True
+
+    @property
+    def best_bid(self) -> tuple[float, float] | None:
+        return self.bids.best
+
+    @property
+    def best_ask(self) -> tuple[float, float] | None:
+        return self.asks.best
+
+    @property
+    def spread(self) -> float | None:
+        if not self.bids or not self.asks:
+            return None
+        return self.asks[0][0] - self.bids[0][0]
+
+    @property
+    def mid(self) -> float | None:
+        if not self.bids or not self.asks:
+            return None
+        return (self.asks[0][0] + self.bids[0][0]) / 2
+
+    def top(self, depth: int = 10) -> dict:
+        """**Best levels of both sides**"""
+        return {'bids': self.bids.top(depth), 'asks': self.asks.top(depth)}
+
+
+class OrderBookManager:
+    """**Local order books of many symbols**
+        Feeds the diff depth stream into an OrderBook per symbol. A book is
+        (re)synchronised from ``get_public_depth()`` on its first event and on
+        every gap in the update ids, events arriving meanwhile are buffered.
+
+    Args:
+        client: Client() for the snapshots
+        symbols: the trading symbols
+        speed: update speed of the stream in ms: 100, 250 or 500. Default 100
+        limit: depth of the snapshots. Default 1000
+        on_update: (optional) function or coroutine called with the OrderBook after every applied event
+    Examples:
+        books = OrderBookManager(client, ['BTCUSDT', 'ETHUSDT'])
+        asyncio.create_task(books.run(WsClient()))
+        ...
+        print(books['BTCUSDT'].best_bid, books['BTCUSDT'].asks.quantity_to(30100))
+    """
+
+    def __init__(self,
+                 client,
+                 symbols: list[str],
+                 speed: int = 100,
+                 limit: int = 1000,
+                 on_update=None):
+        self.client = client
+        self.speed = speed
+        self.limit = limit
+        self.on_update = on_update
+        self.books: dict[str, OrderBook] = {symbol.upper(): OrderBook(symbol.upper()) for symbol in symbols}
+        self._buffers: dict[str, list[dict | DepthUpdate]] = {}
+        self._syncing: dict[str, asyncio.Task] = {}
+
+    def __getitem__(self, symbol: str) -> OrderBook:
+        return self.books[symbol]
+
+    @property
+    def streams(self) -> list[str]:
+        return [f"{symbol.lower()}@depth@{self.speed}ms" for symbol in self.books]
+
+    async def run(self, ws) -> None:
+        """**Listen to the diff depth streams of all symbols**
+
+        Args:
+            ws: WsClient(), plain or typed
+        """
+        try:
+            await ws.subscription_streams(self.streams, self.feed)
+        finally:
+            await self.aclose()
+
+    async def feed(self, message: dict | DepthUpdate) -> None:
+        """**Process a depthUpdate event, decoded or typed, plain or wrapped by a combined stream**"""
+        event = message.get('data', message) if isinstance(message, dict) else message
+        if isinstance(event, DepthUpdate):
+            symbol = event.symbol
+        elif isinstance(event, dict) and event.get('e') == 'depthUpdate':
+            symbol = event['s']
+        else:
+            return
+        book = self.books.get(symbol)
+        if book is None:
+            return
+        if symbol in self._syncing:
+            self._buffers[symbol].append(event)
+            return
+        if not book.apply(event):
+            self.__resync(book, event)
+            return
+        await self.__notify(book)
+
+    async def __notify(self, book: OrderBook) -> None:
+        if self.on_update is not None:
+            called = self.on_update(book)
+            if asyncio.iscoroutine(called):
+                await called
+
+    def __resync(self, book: OrderBook, event: dict | DepthUpdate) -> None:
+        if book.last_update_id is not None:
+            book.resyncs += 1
+            first_id = event.first_id if isinstance(event, DepthUpdate) else event['U']
+            logger.log('WEBSOCKET', f'Order book {book.symbol} is out of sync at {first_id}, new snapshot...')
+        self._buffers[book.symbol] = [event]
+        self._syncing[book.symbol] = asyncio.ensure_future(self.__sync(book))
+
+    async def __sync(self, book: OrderBook) -> None:
+        try:
+            while True:
+                try:
+                    with self.client.response_mode('full'):
+                        res = await self.client.get_public_depth(book.symbol, limit=self.limit)
+                except Exception as err:
+                    logger.warning(f"(Binance Futures Api) Order book snapshot of {book.symbol} failed | {err}")
+                    await asyncio.sleep(1)
+                    continue
+                book.load_snapshot(res['data'])
+                events, self._buffers[book.symbol] = self._buffers[book.symbol], []
+                if all(book.apply(event) for event in events):
+                    break
+                # The snapshot is older than the buffered events, take a newer one.
+                await asyncio.sleep(0.1)
+        finally:
+            self._syncing.pop(book.symbol, None)
+            self._buffers.pop(book.symbol, None)
+        await self.__notify(book)
+
+    @property
+    def stats(self) -> dict:
+        """**Updates, resyncs and state per symbol**"""
+        return {
+            symbol: {
+                'synced': book.synced,
+                'last_update_id': book.last_update_id,
+                'updates': book.updates,
+                'resyncs': book.resyncs,
+                'bids': len(book.bids),
+                'asks': len(book.asks)
+            }
+            for symbol, book in self.books.items()
+        }
+
+    async def aclose(self) -> None:
+        """**Stop pending snapshots**"""
+        tasks = list(self._syncing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,166 @@
+import asyncio
+from collections import deque
+from typing import Callable, Hashable
+
+from loguru import logger
+
+OVERFLOW_POLICIES = ('block', 'drop_oldest', 'drop_newest', 'conflate')
+
+# Events of which only the latest value per symbol matters.
+LATEST_EVENTS = frozenset(('bookTicker', 'markPriceUpdate', '24hrTicker', '24hrMiniTicker'))
+
+# Arrays of all-market streams that hold every symbol, not only the changed ones.
+SNAPSHOT_ARRAYS = frozenset(('markPriceUpdate',))
+
+
+def latest_key(message: dict | list) -> Hashable:
+    """**Conflation key of a message: event type and symbol**
+        Plain and combined stream messages are keyed alike. ``!markPrice@arr``
+        arrays hold every symbol and are keyed by their event type, the ticker
+        arrays hold only the changed symbols and are never conflated. Other
+        events get a key of their own, they are never conflated either.
+    """
+    data = message.get('data', message) if isinstance(message, dict) else message
+    if isinstance(data, list):
+        if data and data[0].get('e') in SNAPSHOT_ARRAYS:
+            return '[]', data[0]['e']
+        return object()
+    event = data.get('e')
+    if event in LATEST_EVENTS:
+        return event, data.get('s')
+    return object()
+
+
+class Delivery:
+    """**Bounded queue between the socket reader and the callback**
+        The reader only decodes and queues messages, consumer tasks call the
+        callback, so a slow callback does not stop the socket from being read.
+
+    Args:
+        callback: function where websocket messages will be processed
+        maxsize: messages kept in the queue. Default 1000
+        overflow: what the reader does with a full queue. Default 'block'
+            'block' waits for a free place, nothing is lost,
+            'drop_oldest' drops the oldest queued message,
+            'drop_newest' drops the message just received,
+            'conflate' keeps only the latest message per key, a new key on a full queue drops the oldest one
+        consumers: tasks calling the callback concurrently, with more than 1 messages may be processed
+            out of order. Default 1
+        key: function of a message giving its conflation key. Default latest_key(), the event type and symbol
+            of bookTicker, markPrice and ticker events
+    """
+
+    def __init__(self,
+                 callback,
+                 maxsize: int = 1000,
+                 overflow: str = 'block',
+                 consumers: int = 1,
+                 key: Callable[[dict], object] = None):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Overflow must be one of {OVERFLOW_POLICIES}")
+        self.callback = callback
+        self.maxsize = max(1, maxsize)
+        self.overflow = overflow
+        self.consumers = max(1, consumers)
+        self.key = key or latest_key
+        self._items: deque | dict = {} if overflow == 'conflate' else deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.blocked = 0
+        self.errors = 0
+        self.max_depth = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def start(self) -> None:
+        """**Start the consumer tasks**"""
+        if not self._tasks:
+            self._tasks = [asyncio.ensure_future(self.__consume()) for _ in range(self.consumers)]
+
+    async def put(self, message: dict) -> None:
+        """**Queue a message with the overflow policy**"""
+        self.received += 1
+        items = self._items
+        if self.overflow == 'conflate':
+            key = self.key(message)
+            if key in items:
+                items[key] = message
+                self.conflated += 1
+                return
+            if len(items) >= self.maxsize:
+                del items[next(iter(items))]
+                self.dropped += 1
+            items[key] = message
+        else:
+            if len(items) >= self.maxsize:
+                if self.overflow == 'drop_newest':
+                    self.dropped += 1
+                    return
+                if self.overflow == 'drop_oldest':
+                    items.popleft()
+                    self.dropped += 1
+                else:
+                    self.blocked += 1
+                    while len(items) >= self.maxsize:
+                        self._not_full.clear()
+                        await self._not_full.wait()
+            items.append(message)
+        if len(items) > self.max_depth:
+            self.max_depth = len(items)
+        self._not_empty.set()
+
+    def __get(self) -> dict:
+        items = self._items
+        if self.overflow == 'conflate':
+            return items.pop(next(iter(items)))
+        return items.popleft()
+
+    async def __consume(self) -> None:
+        while True:
+            while not self._items:
+                self._not_empty.clear()
+                await self._not_empty.wait()
+            message = self.__get()
+            self._not_full.set()
+            try:
+                await self.callback(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                self.errors += 1
+                logger.exception(f"Error in the websocket callback | {err}")
+            self.delivered += 1
+
+    async def join(self) -> None:
+        """**Wait until the queued messages have been taken by the consumers**"""
+        while self._items:
+            self._not_full.clear()
+            await self._not_full.wait()
+
+    @property
+    def stats(self) -> dict:
+        """**Counters of the queue**"""
+        return {
+            'overflow': self.overflow,
+            'queued': len(self._items),
+            'max_depth': self.max_depth,
+            'received': self.received,
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'conflated': self.conflated,
+            'blocked': self.blocked,
+            'errors': self.errors
+        }
+
+    async def aclose(self) -> None:
+        """**Stop the consumers, queued messages are discarded**"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,169 @@
+class Event:
+    """**Market stream event with numeric fields parsed**
+        Events keep their fields in ``__slots__``, they take a fraction of the
+        memory of the decoded dict.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class AggTrade(Event):
+    """**Aggregate trade of stream_agg_trade()**"""
+
+    __slots__ = ('event_time', 'symbol', 'id', 'price', 'quantity', 'first_id', 'last_id', 'trade_time',
+                 'buyer_maker')
+
+    def __init__(self, data: dict):
+        self.event_time: int = data['E']
+        self.symbol: str = data['s']
+        self.id: int = data['a']
+        self.price = float(data['p'])
+        self.quantity = float(data['q'])
+        self.first_id: int = data['f']
+        self.last_id: int = data['l']
+        self.trade_time: int = data['T']
+        self.buyer_maker: bool = data['m']
+
+
+class Kline(Event):
+    """**Kline of stream_kline() and stream_continuous_kline()**"""
+
+    __slots__ = ('event_time', 'symbol', 'interval', 'open_time', 'close_time', 'open', 'high', 'low', 'close',
+                 'volume', 'quote_volume', 'trades', 'taker_buy_volume', 'taker_buy_quote_volume', 'closed')
+
+    def __init__(self, data: dict):
+        kline = data['k']
+        self.event_time: int = data['E']
+        self.symbol: str = data.get('s') or data.get('ps')
+        self.interval: str = kline['i']
+        self.open_time: int = kline['t']
+        self.close_time: int = kline['T']
+        self.open = float(kline['o'])
+        self.high = float(kline['h'])
+        self.low = float(kline['l'])
+        self.close = float(kline['c'])
+        self.volume = float(kline['v'])
+        self.quote_volume = float(kline['q'])
+        self.trades: int = kline['n']
+        self.taker_buy_volume = float(kline['V'])
+        self.taker_buy_quote_volume = float(kline['Q'])
+        self.closed: bool = kline['x']
+
+
+class BookTicker(Event):
+    """**Best bid and ask of stream_book_ticker()**"""
+
+    __slots__ = ('update_id', 'event_time', 'transaction_time', 'symbol', 'bid_price', 'bid_quantity',
+                 'ask_price', 'ask_quantity')
+
+    def __init__(self, data: dict):
+        self.update_id: int = data['u']
+        self.event_time: int = data['E']
+        self.transaction_time: int = data['T']
+        self.symbol: str = data['s']
+        self.bid_price = float(data['b'])
+        self.bid_quantity = float(data['B'])
+        self.ask_price = float(data['a'])
+        self.ask_quantity = float(data['A'])
+
+
+class MarkPrice(Event):
+    """**Mark price and funding rate of stream_mark_price()**"""
+
+    __slots__ = ('event_time', 'symbol', 'mark_price', 'index_price', 'settle_price', 'funding_rate',
+                 'next_funding_time')
+
+    def __init__(self, data: dict):
+        self.event_time: int = data['E']
+        self.symbol: str = data['s']
+        self.mark_price = float(data['p'])
+        self.index_price = float(data['i'])
+        self.settle_price = float(data['P'])
+        self.funding_rate = float(data['r']) if data['r'] else None
+        self.next_funding_time: int = data['T']
+
+
+class Liquidation(Event):
+    """**Liquidation order of stream_liquidation_order()**"""
+
+    __slots__ = ('event_time', 'symbol', 'side', 'order_type', 'time_in_force', 'quantity', 'price',
+                 'average_price', 'status', 'last_filled', 'filled', 'trade_time')
+
+    def __init__(self, data: dict):
+        order = data['o']
+        self.event_time: int = data['E']
+        self.symbol: str = order['s']
+        self.side: str = order['S']
+        self.order_type: str = order['o']
+        self.time_in_force: str = order['f']
+        self.quantity = float(order['q'])
+        self.price = float(order['p'])
+        self.average_price = float(order['ap'])
+        self.status: str = order['X']
+        self.last_filled = float(order['l'])
+        self.filled = float(order['z'])
+        self.trade_time: int = order['T']
+
+
+class DepthUpdate(Event):
+    """**Depth of stream_diff_book_depth() and stream_partial_book_depth()**
+        bids and asks are tuples of (price, quantity).
+    """
+
+    __slots__ = ('event_time', 'transaction_time', 'symbol', 'first_id', 'last_id', 'previous_id', 'bids', 'asks')
+
+    def __init__(self, data: dict):
+        self.event_time: int = data['E']
+        self.transaction_time: int = data['T']
+        self.symbol: str = data['s']
+        self.first_id: int = data['U']
+        self.last_id: int = data['u']
+        self.previous_id: int = data['pu']
+        self.bids = tuple((float(price), float(quantity)) for price, quantity in data['b'])
+        self.asks = tuple((float(price), float(quantity)) for price, quantity in data['a'])
+
+
+# Event class by the event type "e" of the payload.
+EVENTS: dict[str, type[Event]] = {
+    'aggTrade': AggTrade,
+    'kline': Kline,
+    'continuous_kline': Kline,
+    'bookTicker': BookTicker,
+    'markPriceUpdate': MarkPrice,
+    'forceOrder': Liquidation,
+    'depthUpdate': DepthUpdate,
+}
+
+
+def decode_event(message: dict | list) -> Event | dict | list:
+    """**Typed event of a stream message**
+        Combined stream messages keep their ``{'stream', 'data'}`` wrapper,
+        arrays of all-market streams become lists. Events without a class
+        are returned as they are.
+    """
+    if isinstance(message, list):
+        return [decode_event(item) for item in message]
+    event = EVENTS.get(message.get('e'))
+    if event is not None:
+        return event(message)
+    if 'stream' in message and 'data' in message:
+        return {'stream': message['stream'], 'data': decode_event(message['data'])}
+    return message
+
+
+def typed_callback(callback):
+    """**Callback that gets typed events, see decode_event()**"""
+    async def decode(message: dict | list) -> None:
+        await callback(decode_event(message))
+    return decode
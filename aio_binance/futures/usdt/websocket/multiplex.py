@@ -0,0 +1,332 @@
+import asyncio
+import itertools
+from typing import Any, Iterable
+
+import aiohttp
+from loguru import logger
+
+from aio_binance.codec import Codec, get_codec
+from aio_binance.error_handler.error import BinanceException
+from aio_binance.futures.usdt.api.limiter import TokenBucket
+from aio_binance.futures.usdt.websocket.delivery import Delivery
+from aio_binance.futures.usdt.websocket.events import typed_callback
+
+# Limits of one market stream connection.
+# See Also: https://binance-docs.github.io/apidocs/futures/en/#websocket-market-streams
+MAX_STREAMS = 200
+MESSAGES_PER_SECOND = 10
+
+
+class Shard:
+    """**One connection of a Multiplexer**
+        Every message sent to the server, control requests, pings and pongs,
+        takes a token of the connection's 10 messages per second.
+    """
+
+    def __init__(self, mux: 'Multiplexer'):
+        self.mux = mux
+        self.index = next(mux.shard_ids)
+        self.streams: set[str] = set()
+        self.control = TokenBucket(mux.messages_per_second, 1)
+        self.pending: dict[int, asyncio.Future] = {}
+        self.connected = asyncio.Event()
+        self.connections = 0
+        self.messages = 0
+        self.ws: aiohttp.ClientWebSocketResponse | None = None
+        self.closed = False
+        self.task = asyncio.ensure_future(self.__run())
+
+    @property
+    def room(self) -> int:
+        return self.mux.max_streams - len(self.streams)
+
+    async def request(self, method: str, params: list[str] = None) -> Any:
+        """**Send a control request and wait for its reply**
+
+        Raises:
+            BinanceException: the server rejected the request
+            asyncio.TimeoutError: no connection or no reply within ack_timeout
+            ConnectionResetError: the connection was lost before the reply, the subscriptions
+                are restored on reconnect
+        """
+        await asyncio.wait_for(self.connected.wait(), self.mux.ack_timeout)
+        future = asyncio.get_running_loop().create_future()
+        request_id = await self.__send(method, params, future)
+        try:
+            return await asyncio.wait_for(future, self.mux.ack_timeout)
+        finally:
+            self.pending.pop(request_id, None)
+
+    async def __send(self, method: str, params: list[str] = None, future: asyncio.Future = None) -> int:
+        await self.control.acquire(1)
+        if self.ws is None:
+            # Lost while waiting for the token.
+            raise ConnectionResetError(f'Connection {self.index} lost')
+        request_id = next(self.mux.ids)
+        if future is not None:
+            self.pending[request_id] = future
+        payload = {'method': method, 'id': request_id}
+        if params is not None:
+            payload['params'] = params
+        await self.ws.send_str(self.mux.codec.dumps(payload))
+        return request_id
+
+    async def __run(self) -> None:
+        while not self.closed:
+            try:
+                async with self.mux.session.ws_connect(self.mux.url, autoclose=False, autoping=False,
+                                                       ssl=True) as self.ws:
+                    logger.log('WEBSOCKET', f'Multiplexer connection {self.index} opened')
+                    if self.connections and self.streams:
+                        logger.log('WEBSOCKET', f'Restoring {len(self.streams)} streams on connection {self.index}')
+                        await self.__send('SUBSCRIBE', sorted(self.streams))
+                    self.connections += 1
+                    self.connected.set()
+                    await self.__dispatch()
+            except (aiohttp.ClientError, OSError, asyncio.TimeoutError) as err:
+                logger.log('WEBSOCKET', f'Multiplexer connection {self.index} error | {err}')
+            except Exception as err:
+                # E.g. a frame that is not JSON, the connection is opened again.
+                logger.error(f"Multiplexer connection {self.index} failed | {err!r}")
+            finally:
+                self.connected.clear()
+                self.ws = None
+                for future in self.pending.values():
+                    if not future.done():
+                        future.set_exception(ConnectionResetError(f'Connection {self.index} lost'))
+                self.pending.clear()
+            if not self.closed:
+                logger.log('WEBSOCKET', f'Retrying connection {self.index} in {self.mux.sleep_time} sec')
+                await asyncio.sleep(self.mux.sleep_time)
+
+    async def __dispatch(self) -> None:
+        pinged = False
+        while not self.closed:
+            try:
+                msg = await self.ws.receive(timeout=self.mux.reply_timeout)
+            except asyncio.TimeoutError:
+                if pinged:
+                    return
+                await self.control.acquire(1)
+                await self.ws.ping()
+                pinged = True
+                continue
+            pinged = False
+            if msg.type == aiohttp.WSMsgType.TEXT:
+                data = self.mux.codec.loads(msg.data)
+                if 'id' in data and ('result' in data or 'error' in data):
+                    self.__reply(data)
+                else:
+                    self.messages += 1
+                    await self.mux.delivery.put(data)
+            elif msg.type == aiohttp.WSMsgType.PING:
+                await self.control.acquire(1)
+                await self.ws.pong(msg.data)
+            elif msg.type == aiohttp.WSMsgType.PONG:
+                continue
+            else:
+                if msg.type == aiohttp.WSMsgType.CLOSE:
+                    await self.ws.close()
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    logger.error(f"Error during receive {self.ws.exception()}")
+                return
+
+    def __reply(self, data: dict) -> None:
+        future = self.pending.pop(data['id'], None)
+        error = data.get('error')
+        if future is None:
+            if error:
+                logger.warning(f"(Binance Futures Api) Multiplexer connection {self.index} | {error}")
+            return
+        if future.done():
+            return
+        if error:
+            future.set_exception(BinanceException(error.get('code'), error.get('msg')))
+        else:
+            future.set_result(data.get('result'))
+
+    async def aclose(self) -> None:
+        self.closed = True
+        if self.ws is not None:
+            await self.ws.close()
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+
+class Multiplexer:
+    """**Many market streams on few connections**
+        Streams are added and removed on live connections with the
+        SUBSCRIBE and UNSUBSCRIBE methods. A new connection is opened when
+        every connection has 200 streams, or when the connections with room
+        have used their 10 control messages of the second. Subscriptions
+        are restored after a reconnect.
+
+    Args:
+        callback_event: Custom function where websocket messages will be processed,
+            they come as ``{'stream': <name>, 'data': <event>}``
+    Keyword Args:
+        max_streams: streams per connection. Default 200
+        messages_per_second: messages sent per connection and second. Default 10
+        max_connections: connections opened to spread the control messages, more are opened
+            only when the streams do not fit. Default 5
+        ack_timeout: seconds to wait for the reply of a control request. Default 10
+        reply_timeout: seconds without a message before a ping. Default 180
+        sleep_time: seconds before a reconnect. Default 3
+        queue_size: messages queued between the connections and the callback. Default 1000
+        overflow: 'block', 'drop_oldest', 'drop_newest' or 'conflate' when the queue is full. Default 'block'
+        consumers: tasks calling the callback concurrently. Default 1
+        conflate_key: (optional) function of a message giving its conflation key. Default latest_key()
+        typed: pass typed events with numeric fields to the callback, see events.decode_event(). Default False
+        codec: (optional) JSON backend 'ujson', 'orjson', 'json' or Codec(). Default 'ujson'
+        session: (optional) aiohttp.ClientSession()
+        url: (optional) combined stream endpoint. Default wss://fstream.binance.com/stream
+    Examples:
+        async with WsClient().multiplex(callback_event) as mux:
+            await mux.subscribe(['btcusdt@aggTrade', 'ethusdt@markPrice@1s'])
+            ...
+            await mux.unsubscribe(['ethusdt@markPrice@1s'])
+    """
+
+    def __init__(self, callback_event, **kwargs):
+        if kwargs.get('typed'):
+            callback_event = typed_callback(callback_event)
+        self.delivery = Delivery(callback_event,
+                                 kwargs.get('queue_size', 1000),
+                                 kwargs.get('overflow', 'block'),
+                                 kwargs.get('consumers', 1),
+                                 kwargs.get('conflate_key'))
+        self.max_streams: int = kwargs.get('max_streams', MAX_STREAMS)
+        self.messages_per_second: int = kwargs.get('messages_per_second', MESSAGES_PER_SECOND)
+        self.max_connections: int = kwargs.get('max_connections', 5)
+        self.ack_timeout: float = kwargs.get('ack_timeout', 10)
+        self.reply_timeout: float = kwargs.get('reply_timeout', 180)
+        self.sleep_time: float = kwargs.get('sleep_time', 3)
+        self.codec: Codec = get_codec(kwargs.get('codec'))
+        self.url: str = kwargs.get('url', 'wss://fstream.binance.com/stream')
+        self._session: aiohttp.ClientSession | None = kwargs.get('session')
+        self._own_session = self._session is None
+        self.shards: list[Shard] = []
+        self.ids = itertools.count(1)
+        self.shard_ids = itertools.count()
+        self._where: dict[str, Shard] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    @property
+    def subscriptions(self) -> list[str]:
+        """**Streams subscribed by this multiplexer**"""
+        return sorted(self._where)
+
+    def __plan(self, streams: list[str]) -> list[tuple[Shard, list[str]]]:
+        plan = []
+        for shard in self.shards:
+            if not streams:
+                break
+            if shard.room <= 0:
+                continue
+            if shard.control.available < 1 and len(self.shards) < self.max_connections:
+                # Busy with control messages, spread them on a new connection.
+                continue
+            plan.append((shard, streams[:shard.room]))
+            streams = streams[shard.room:]
+        while streams:
+            shard = Shard(self)
+            self.shards.append(shard)
+            plan.append((shard, streams[:self.max_streams]))
+            streams = streams[self.max_streams:]
+        return plan
+
+    async def subscribe(self, streams: Iterable[str]) -> None:
+        """**Subscribe to streams on the live connections**
+
+        Args:
+            streams: stream names, e.g. 'btcusdt@aggTrade'
+        Raises:
+            BinanceException: the server rejected a request, its streams are not kept
+            asyncio.TimeoutError: no connection or no reply in time, its streams are not kept,
+                a new connection left without streams is closed
+        """
+        self.delivery.start()
+        streams = [stream for stream in dict.fromkeys(streams) if stream not in self._where]
+        plan = self.__plan(streams)
+        for shard, batch in plan:
+            shard.streams.update(batch)
+            self._where.update(dict.fromkeys(batch, shard))
+        results = await asyncio.gather(*(shard.request('SUBSCRIBE', batch) for shard, batch in plan),
+                                       return_exceptions=True)
+        for (shard, batch), result in zip(plan, results):
+            if isinstance(result, (BinanceException, asyncio.TimeoutError)):
+                shard.streams.difference_update(batch)
+                for stream in batch:
+                    self._where.pop(stream, None)
+                if not shard.streams and shard in self.shards:
+                    self.shards.remove(shard)
+                    await shard.aclose()
+        self.__raise(results)
+
+    @staticmethod
+    def __raise(results: list) -> None:
+        # After a lost connection the subscriptions are restored on reconnect.
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, ConnectionResetError):
+                raise result
+
+    async def unsubscribe(self, streams: Iterable[str]) -> None:
+        """**Unsubscribe from streams, a connection left without streams is closed**
+
+        Args:
+            streams: stream names
+        """
+        batches: dict[Shard, list[str]] = {}
+        for stream in dict.fromkeys(streams):
+            shard = self._where.pop(stream, None)
+            if shard is not None:
+                shard.streams.discard(stream)
+                batches.setdefault(shard, []).append(stream)
+        results = await asyncio.gather(*(self.__unsubscribe(shard, batch) for shard, batch in batches.items()),
+                                       return_exceptions=True)
+        self.__raise(results)
+
+    async def __unsubscribe(self, shard: Shard, batch: list[str]) -> None:
+        if shard.streams:
+            await shard.request('UNSUBSCRIBE', batch)
+            return
+        self.shards.remove(shard)
+        await shard.aclose()
+
+    async def list_subscriptions(self) -> list[str]:
+        """**Streams subscribed on the server, from LIST_SUBSCRIPTIONS of every connection**"""
+        results = await asyncio.gather(*(shard.request('LIST_SUBSCRIPTIONS') for shard in self.shards))
+        return sorted(stream for result in results for stream in result or ())
+
+    @property
+    def stats(self) -> dict:
+        """**Counters of the queue and streams, messages, connections and control messages per connection**"""
+        return {'delivery': self.delivery.stats, 'connections': [{
+            'connection': shard.index,
+            'connected': shard.connected.is_set(),
+            'streams': len(shard.streams),
+            'messages': shard.messages,
+            'connections': shard.connections,
+            'control': shard.control.metrics
+        } for shard in self.shards]}
+
+    async def aclose(self) -> None:
+        """**Close every connection**"""
+        shards, self.shards = self.shards, []
+        self._where.clear()
+        await asyncio.gather(*(shard.aclose() for shard in shards), return_exceptions=True)
+        await self.delivery.aclose()
+        if self._own_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
@@ -1,13 +1,31 @@
 import asyncio
 import socket
+from typing import Callable
 
 import aiohttp
 from loguru import logger
 
+from aio_binance.codec import Codec, get_codec
+from aio_binance.futures.usdt.websocket.delivery import Delivery
+from aio_binance.futures.usdt.websocket.events import typed_callback
+from aio_binance.futures.usdt.websocket.multiplex import Multiplexer
+
 
 class Ws:
-    """
+    """**Websocket connection**
 
+    Keyword Args:
+        listen_key: (optional) listenKey of the user data stream
+        reply_timeout: seconds without a message before a ping. Default 180
+        ping_timeout: seconds to wait for the pong. Default 300
+        sleep_time: seconds before a reconnect. Default 3
+        codec: (optional) JSON backend 'ujson', 'orjson', 'json' or Codec(). Default 'ujson'
+        queue_size: messages queued between the socket and the callback. Default 1000
+        overflow: 'block', 'drop_oldest', 'drop_newest' or 'conflate' when the queue is full. Default 'block'
+            'conflate' delivers only the latest bookTicker, markPrice and ticker event per symbol
+        consumers: tasks calling the callback concurrently. Default 1
+        conflate_key: (optional) function of a message giving its conflation key. Default latest_key()
+        typed: pass typed events with numeric fields to the callback, see events.decode_event(). Default False
     """
 
     def __init__(self, **kwargs):
@@ -15,21 +33,53 @@ class Ws:
         self.reply_timeout: int = kwargs.get('reply_timeout', 180)
         self.ping_timeout: int = kwargs.get('ping_timeout', 300)
         self.sleep_time: int = kwargs.get('sleep_time', 3)
+        self.codec: Codec = get_codec(kwargs.get('codec'))
+        self.queue_size: int = kwargs.get('queue_size', 1000)
+        self.overflow: str = kwargs.get('overflow', 'block')
+        self.consumers: int = kwargs.get('consumers', 1)
+        self.conflate_key: Callable | None = kwargs.get('conflate_key')
+        self.typed: bool = kwargs.get('typed', False)
+        self.delivery: Delivery | None = None
+
+    def multiplex(self, callback_event: object, **kwargs) -> Multiplexer:
+        """**Multiplexer of market streams with the codec and timeouts of this client**
+
+        Args:
+            callback_event: Custom function where websocket messages will be processed.
+        Keyword Args:
+            keyword arguments of Multiplexer()
+        """
+        kwargs.setdefault('codec', self.codec)
+        kwargs.setdefault('reply_timeout', self.reply_timeout)
+        kwargs.setdefault('sleep_time', self.sleep_time)
+        kwargs.setdefault('queue_size', self.queue_size)
+        kwargs.setdefault('overflow', self.overflow)
+        kwargs.setdefault('consumers', self.consumers)
+        kwargs.setdefault('conflate_key', self.conflate_key)
+        kwargs.setdefault('typed', self.typed)
+        return Multiplexer(callback_event, **kwargs)
 
     async def _listen_forever(self, path: str, event: object) -> None:
         _url = self.__create_url(path)
         self.quit = False
-        while True:
-            if self.quit:
-                break
-            async with aiohttp.ClientSession() as client:
-                async with client.ws_connect(_url, autoclose=False, autoping=False, ssl=True) as self.ws:
-                    logger.log('WEBSOCKET', f'Creating new connection {_url}')
-                    msg = 'user_data' if self.listen_key else path
-                    logger.log('WEBSOCKET', f'Now you can expect new events {msg} in the function passed to me...')
-                    await self.__dispatch(event)
+        if self.typed:
+            event = typed_callback(event)
+        self.delivery = Delivery(event, self.queue_size, self.overflow, self.consumers, self.conflate_key)
+        self.delivery.start()
+        try:
+            while True:
+                if self.quit:
+                    break
+                async with aiohttp.ClientSession() as client:
+                    async with client.ws_connect(_url, autoclose=False, autoping=False, ssl=True) as self.ws:
+                        logger.log('WEBSOCKET', f'Creating new connection {_url}')
+                        msg = 'user_data' if self.listen_key else path
+                        logger.log('WEBSOCKET', f'Now you can expect new events {msg} in the function passed to me...')
+                        await self.__dispatch()
+        finally:
+            await self.delivery.aclose()
 
-    async def __dispatch(self, event) -> None:
+    async def __dispatch(self) -> None:
         while True:
             if self.quit:
                 break
@@ -66,7 +116,7 @@ class Ws:
                 continue
             else:
                 if msg.type == aiohttp.WSMsgType.TEXT:
-                    await event(msg.json())
+                    await self.delivery.put(self.codec.loads(msg.data))
                 elif msg.type == aiohttp.WSMsgType.PING:
                     await self.ws.pong()
                 elif msg.type == aiohttp.WSMsgType.PONG:
@@ -41,7 +41,7 @@ class AioTimer(ContextDecorator):
         self._start_time = None
 
         # Report elapsed time
-        logger.log('TIMER', self.text.format(self.name, elapsed_time * 1000))
+        logger.log('TIMER', self.text, self.name, elapsed_time * 1000)
         if self.name:
             self.timers[self.name] += elapsed_time
 
@@ -88,7 +88,7 @@ class Timer(ContextDecorator):
         self._start_time = None
 
         # Report elapsed time
-        logger.log('TIMER', self.text.format(self.name, elapsed_time))
+        logger.log('TIMER', self.text, self.name, elapsed_time)
         if self.name:
             self.timers[self.name] += elapsed_time
 
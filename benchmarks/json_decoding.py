@@ -0,0 +1,83 @@
+"""Decode throughput of the JSON codecs on representative payloads.
+
+Payloads are built in the shape Binance returns them: exchangeInfo with
+250 symbols, a depth snapshot of 1000 levels and a ``!ticker@arr`` frame.
+Every codec decodes the raw ``bytes`` as the REST client reads them and
+the ``str`` of a websocket text frame. ``text + ujson`` is the old REST
+path: ``response.text()`` followed by ``ujson.loads``.
+"""
+import random
+import timeit
+
+from aio_binance.codec import CODECS
+
+SYMBOLS = 250
+NUMBER = 20
+
+
+def exchange_info() -> dict:
+    filters = [
+        {'filterType': 'PRICE_FILTER', 'minPrice': '0.10', 'maxPrice': '1000000', 'tickSize': '0.10'},
+        {'filterType': 'LOT_SIZE', 'stepSize': '0.001', 'maxQty': '1000', 'minQty': '0.001'},
+        {'filterType': 'MARKET_LOT_SIZE', 'stepSize': '0.001', 'maxQty': '1000', 'minQty': '0.001'},
+        {'filterType': 'MAX_NUM_ORDERS', 'limit': 200},
+        {'filterType': 'MAX_NUM_ALGO_ORDERS', 'limit': 10},
+        {'filterType': 'MIN_NOTIONAL', 'notional': '5'},
+        {'filterType': 'PERCENT_PRICE', 'multiplierUp': '1.0500', 'multiplierDown': '0.9500',
+         'multiplierDecimal': '4'},
+    ]
+    symbols = [{
+        'symbol': f'SYM{i}USDT', 'pair': f'SYM{i}USDT', 'contractType': 'PERPETUAL',
+        'deliveryDate': 4133404800000, 'onboardDate': 1569398400000, 'status': 'TRADING',
+        'maintMarginPercent': '2.5000', 'requiredMarginPercent': '5.0000', 'baseAsset': f'SYM{i}',
+        'quoteAsset': 'USDT', 'marginAsset': 'USDT', 'pricePrecision': 2, 'quantityPrecision': 3,
+        'baseAssetPrecision': 8, 'quotePrecision': 8, 'underlyingType': 'COIN', 'underlyingSubType': [],
+        'settlePlan': 0, 'triggerProtect': '0.0500', 'liquidationFee': '0.017500', 'marketTakeBound': '0.05',
+        'filters': filters, 'orderTypes': ['LIMIT', 'MARKET', 'STOP', 'STOP_MARKET', 'TAKE_PROFIT',
+                                           'TAKE_PROFIT_MARKET', 'TRAILING_STOP_MARKET'],
+        'timeInForce': ['GTC', 'IOC', 'FOK', 'GTX']
+    } for i in range(SYMBOLS)]
+    return {
+        'timezone': 'UTC', 'serverTime': 1565246363776, 'futuresType': 'U_MARGINED',
+        'rateLimits': [{'rateLimitType': 'REQUEST_WEIGHT', 'interval': 'MINUTE', 'intervalNum': 1, 'limit': 2400}],
+        'exchangeFilters': [], 'assets': [{'asset': 'USDT', 'marginAvailable': True, 'autoAssetExchange': '-10000'}],
+        'symbols': symbols
+    }
+
+
+def depth() -> dict:
+    return {
+        'lastUpdateId': 1027024, 'E': 1589436922972, 'T': 1589436922959,
+        'bids': [[f'{50000 - i * 0.1:.1f}', f'{random.uniform(0, 10):.3f}'] for i in range(1000)],
+        'asks': [[f'{50000 + i * 0.1:.1f}', f'{random.uniform(0, 10):.3f}'] for i in range(1000)]
+    }
+
+
+def ticker_arr() -> list:
+    return [{
+        'e': '24hrTicker', 'E': 123456789, 's': f'SYM{i}USDT', 'p': '0.0015', 'P': '250.00', 'w': '0.0018',
+        'c': '0.0025', 'Q': '10', 'o': '0.0010', 'h': '0.0025', 'l': '0.0010', 'v': '10000', 'q': '18',
+        'O': 0, 'C': 86400000, 'F': 0, 'L': 18150, 'n': 18151
+    } for i in range(SYMBOLS)]
+
+
+def main():
+    random.seed(7)
+    dumps = CODECS['ujson'].dumps
+    for name, payload in (('exchangeInfo', exchange_info()), ('depth 1000', depth()),
+                          ('!ticker@arr', ticker_arr())):
+        text = dumps(payload)
+        raw = text.encode()
+        print(f"{name}, {len(raw) / 1024:.0f} KB")
+        cases = [('text + ujson', lambda: CODECS['ujson'].loads(raw.decode('utf-8')))]
+        for codec in CODECS.values():
+            assert codec.loads(raw) == codec.loads(text) == payload
+            cases.append((f'{codec.name} bytes', lambda loads=codec.loads: loads(raw)))
+            cases.append((f'{codec.name} str', lambda loads=codec.loads: loads(text)))
+        for label, func in cases:
+            best = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+            print(f"    {label:<14} {best * 1e6:9.1f} us  {len(raw) / best / 1e6:7.1f} MB/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Decoding cost of numeric market data, 100k rows per endpoint.
+
+``rows`` is the usual path: ``ujson.loads`` into lists and dicts of strings
+and a ``float()`` per value, as strategies did with the default result.
+``columnar`` is ``columnar=True`` of the client: the response text is
+parsed by numpy in one pass into typed arrays.
+"""
+import random
+import timeit
+
+import numpy as np
+import ujson
+
+from aio_binance.futures.usdt.api.columnar import (decode_agg_trades, decode_depth,
+                                                   decode_funding_rate, decode_klines)
+
+ROWS = 100_000
+NUMBER = 5
+
+
+def klines_body() -> str:
+    rows, time = [], 1640995200000
+    for _ in range(ROWS):
+        price = random.uniform(30000, 60000)
+        rows.append([time, f'{price:.2f}', f'{price * 1.01:.2f}', f'{price * 0.99:.2f}', f'{price:.2f}',
+                     f'{random.uniform(0, 500):.3f}', time + 59999, f'{random.uniform(0, 1e7):.5f}',
+                     random.randint(0, 5000), f'{random.uniform(0, 250):.3f}', f'{random.uniform(0, 5e6):.5f}', '0'])
+        time += 60000
+    return ujson.dumps(rows)
+
+
+def depth_body() -> str:
+    return ujson.dumps({
+        'lastUpdateId': 1027024, 'E': 1589436922972, 'T': 1589436922959,
+        'bids': [[f'{50000 - i * 0.1:.1f}', f'{random.uniform(0, 10):.3f}'] for i in range(ROWS // 2)],
+        'asks': [[f'{50000 + i * 0.1:.1f}', f'{random.uniform(0, 10):.3f}'] for i in range(ROWS // 2)]
+    })
+
+
+def agg_trades_body() -> str:
+    return ujson.dumps([
+        {'a': 26129 + i, 'p': f'{random.uniform(30000, 60000):.2f}', 'q': f'{random.uniform(0, 5):.3f}',
+         'f': 27781 + i, 'l': 27781 + i, 'T': 1498793709153 + i, 'm': i % 3 == 0}
+        for i in range(ROWS)])
+
+
+def funding_rate_body() -> str:
+    return ujson.dumps([
+        {'symbol': 'BTCUSDT', 'fundingTime': 1570608000000 + i * 28800000,
+         'fundingRate': f'{random.uniform(-0.001, 0.001):.8f}', 'markPrice': f'{random.uniform(30000, 60000):.8f}'}
+        for i in range(ROWS)])
+
+
+def klines_rows(body: str):
+    return [[row[0], float(row[1]), float(row[2]), float(row[3]), float(row[4]), float(row[5]),
+             row[6], float(row[7]), row[8], float(row[9]), float(row[10])] for row in ujson.loads(body)]
+
+
+def depth_rows(body: str):
+    book = ujson.loads(body)
+    return ([(float(price), float(qty)) for price, qty in book['bids']],
+            [(float(price), float(qty)) for price, qty in book['asks']])
+
+
+def agg_trades_rows(body: str):
+    return [(row['a'], float(row['p']), float(row['q']), row['f'], row['l'], row['T'], row['m'])
+            for row in ujson.loads(body)]
+
+
+def funding_rate_rows(body: str):
+    return [(row['fundingTime'], float(row['fundingRate']), float(row['markPrice'])) for row in ujson.loads(body)]
+
+
+CASES = (
+    ('klines', klines_body, klines_rows, decode_klines),
+    ('depth', depth_body, depth_rows, decode_depth),
+    ('agg_trades', agg_trades_body, agg_trades_rows, decode_agg_trades),
+    ('funding_rate', funding_rate_body, funding_rate_rows, decode_funding_rate),
+)
+
+
+def check(body: str, rows, columns: dict) -> None:
+    if isinstance(rows, tuple):
+        assert np.array_equal(np.array(rows[0]), columns['bids'])
+        assert np.array_equal(np.array(rows[1]), columns['asks'])
+        return
+    for number, values in enumerate(columns.values()):
+        assert np.array_equal(np.array([row[number] for row in rows]), values)
+
+
+def main():
+    random.seed(7)
+    for name, body, rows, columnar in CASES:
+        text = body()
+        check(text, rows(text), columnar(text))
+        print(f"{name}, {len(text) / 1e6:.1f} MB")
+        for mode, func in (('rows', rows), ('columnar', columnar)):
+            best = min(timeit.repeat(lambda: func(text), number=NUMBER, repeat=3)) / NUMBER
+            print(f"    {mode:<9} {best * 1000:8.1f} ms  {best / ROWS * 1e9:6.0f} ns per row")
+
+
+if __name__ == '__main__':
+    main()
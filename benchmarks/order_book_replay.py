@@ -0,0 +1,108 @@
+"""Replay of diff depth events into local order books.
+
+A synthetic stream of ``depthUpdate`` events for 10 symbols (1000 levels
+per side, 20 level changes per event, a third of them removals) is fed
+through ``OrderBookManager.feed`` after a snapshot. ``dict`` is the usual
+hand-written book for comparison: a dict of price: quantity per side and a
+sort to read the best levels. Both read the top 10 levels after every
+event, as a strategy does.
+"""
+import asyncio
+import random
+import time
+
+from aio_binance.futures.usdt import OrderBookManager
+
+SYMBOLS = [f'SYM{index}USDT' for index in range(10)]
+LEVELS = 1000
+EVENTS = 20_000
+CHANGES = 20
+TICK = 0.1
+
+
+def snapshot(mid: float) -> dict:
+    return {
+        'lastUpdateId': 1000,
+        'E': 0,
+        'T': 0,
+        'bids': [[f'{mid - TICK * (i + 1):.1f}', f'{random.uniform(0.001, 5):.3f}'] for i in range(LEVELS)],
+        'asks': [[f'{mid + TICK * (i + 1):.1f}', f'{random.uniform(0.001, 5):.3f}'] for i in range(LEVELS)]
+    }
+
+
+def events(symbol: str, mid: float, count: int) -> list[dict]:
+    result, last = [], 999
+    for _ in range(count):
+        mid += random.choice((-TICK, 0, TICK))
+        bids, asks = [], []
+        for _ in range(CHANGES):
+            side, sign = (bids, -1) if random.random() < 0.5 else (asks, 1)
+            price = mid + sign * TICK * random.randint(1, 200)
+            quantity = 0 if random.random() < 0.33 else random.uniform(0.001, 5)
+            side.append([f'{price:.1f}', f'{quantity:.3f}'])
+        previous, last = last, last + 1 + random.randint(0, 5)
+        result.append({'e': 'depthUpdate', 'E': last, 'T': last, 's': symbol,
+                       'U': previous + 1, 'u': last, 'pu': previous, 'b': bids, 'a': asks})
+    return result
+
+
+class DictBook:
+
+    def __init__(self, data: dict):
+        self.bids = {float(p): float(q) for p, q in data['bids']}
+        self.asks = {float(p): float(q) for p, q in data['asks']}
+
+    def apply(self, event: dict) -> None:
+        for levels, side in ((event['b'], self.bids), (event['a'], self.asks)):
+            for price, quantity in levels:
+                price, quantity = float(price), float(quantity)
+                if quantity:
+                    side[price] = quantity
+                else:
+                    side.pop(price, None)
+
+    def top(self, depth: int) -> dict:
+        return {'bids': sorted(self.bids.items(), reverse=True)[:depth], 'asks': sorted(self.asks.items())[:depth]}
+
+
+def interleave(streams: list[list[dict]]) -> list[dict]:
+    return [event for group in zip(*streams) for event in group]
+
+
+async def replay_manager(snapshots: dict, stream: list[dict]) -> float:
+    books = OrderBookManager(None, SYMBOLS, on_update=lambda book: book.top(10))
+    for symbol, data in snapshots.items():
+        books[symbol].load_snapshot(data)
+    start = time.perf_counter()
+    for event in stream:
+        await books.feed(event)
+    elapsed = time.perf_counter() - start
+    assert all(book.updates == EVENTS // len(SYMBOLS) and not book.resyncs for book in books.books.values())
+    return elapsed
+
+
+def replay_dict(snapshots: dict, stream: list[dict]) -> float:
+    books = {symbol: DictBook(data) for symbol, data in snapshots.items()}
+    start = time.perf_counter()
+    for event in stream:
+        book = books[event['s']]
+        book.apply(event)
+        book.top(10)
+    return time.perf_counter() - start
+
+
+def main():
+    random.seed(1)
+    mids = {symbol: 30000.0 + 100 * index for index, symbol in enumerate(SYMBOLS)}
+    per_symbol = EVENTS // len(SYMBOLS)
+    stream = interleave([events(symbol, mid, per_symbol) for symbol, mid in mids.items()])
+    snapshots = {symbol: snapshot(mid) for symbol, mid in mids.items()}
+    for label, elapsed in (('dict', replay_dict(snapshots, stream)),
+                           ('manager', asyncio.run(replay_manager(snapshots, stream)))):
+        rate = len(stream) / elapsed
+        print(f"{label:<8} {rate:>10,.0f} events/s  {rate / len(SYMBOLS):>9,.0f} events/s per symbol"
+              f"  {rate * CHANGES:>12,.0f} levels/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Cost of translating keyword parameters to Binance names.
+
+``legacy`` is the translation the client did before: split, title and
+join of every key of every order. ``current`` is ``FactoryApi._to_api``
+with the precomputed table, the camelCase fast path and the batch
+translator. Inputs are a batch of 5 orders, 1000 orders and the kwargs
+of one call, both in snake_case and already in camelCase.
+"""
+import timeit
+
+from aio_binance.futures.usdt import Client
+from aio_binance.futures.usdt.api.params import snake_to_camel
+
+
+def legacy(data: dict | list) -> dict | list:
+    _data = None
+    if isinstance(data, dict):
+        _data = dict()
+        for key, value in data.items():
+            _data[snake_to_camel(key)] = value
+    elif isinstance(data, list):
+        _data = list()
+        for item in data:
+            _d = dict()
+            for key, value in item.items():
+                _d[snake_to_camel(key)] = value
+            _data.append(_d)
+    return _data
+
+
+ORDER = {
+    'symbol': 'BTCUSDT',
+    'side': 'BUY',
+    'type': 'LIMIT',
+    'position_side': 'LONG',
+    'time_in_force': 'GTC',
+    'quantity': '0.002',
+    'price': '59808.02',
+    'new_client_order_id': 'grid-level-17',
+    'working_type': 'CONTRACT_PRICE',
+    'price_protect': 'false'
+}
+CAMEL_ORDER = {snake_to_camel(key): value for key, value in ORDER.items()}
+KWARGS = {'start_time': 1640995200000, 'end_time': 1641081600000, 'limit': 1000}
+
+CASES = (
+    ('kwargs of a call', KWARGS, 200_000),
+    ('5 orders', [dict(ORDER) for _ in range(5)], 50_000),
+    ('5 orders camelCase', [dict(CAMEL_ORDER) for _ in range(5)], 50_000),
+    ('1000 orders', [dict(ORDER) for _ in range(1000)], 200),
+    ('1000 orders camelCase', [dict(CAMEL_ORDER) for _ in range(1000)], 200),
+)
+
+
+def main():
+    current = Client(debug='error')._to_api
+    for name, data, number in CASES:
+        assert current(data) == legacy(data)
+        print(name)
+        for label, func in (('legacy', legacy), ('current', current)):
+            best = min(timeit.repeat(lambda: func(data), number=number, repeat=5)) / number
+            print(f"    {label:<8} {best * 1e6:9.2f} us")
+
+
+if __name__ == '__main__':
+    main()
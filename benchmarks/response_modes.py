@@ -0,0 +1,101 @@
+"""Allocations per request in the full, data and raw response modes.
+
+A local server in another process answers ``/fapi/v1/depth`` with a
+snapshot of 10 levels, a typical hot call, and the usual X-MBX-* headers.
+For every mode the client sends the same requests one by one and keeps
+the results, then ``tracemalloc`` reports the memory blocks still held
+per request. The time per request is measured in a separate pass
+without tracing.
+"""
+import asyncio
+import multiprocessing
+import random
+import socket
+import time
+import tracemalloc
+
+import ujson
+from aiohttp import web
+
+from aio_binance.futures.usdt import Client, RateLimiter
+from aio_binance.futures.usdt.api.limiter import TokenBucket
+
+REQUESTS = 500
+HEADERS = {
+    'Content-Type': 'application/json',
+    'X-MBX-USED-WEIGHT-1M': '25',
+    'X-MBX-ORDER-COUNT-10S': '1',
+    'X-MBX-ORDER-COUNT-1M': '4'
+}
+
+
+def serve(port: int) -> None:
+    random.seed(7)
+    body = ujson.dumps({
+        'lastUpdateId': 1027024, 'E': 1589436922972, 'T': 1589436922959,
+        'bids': [[f'{50000 - i * 0.1:.1f}', f'{random.uniform(0, 10):.3f}'] for i in range(10)],
+        'asks': [[f'{50000 + i * 0.1:.1f}', f'{random.uniform(0, 10):.3f}'] for i in range(10)]
+    })
+
+    async def depth(_):
+        return web.Response(text=body, headers=HEADERS)
+
+    async def ping(_):
+        return web.Response(text='{}', headers=HEADERS)
+
+    app = web.Application()
+    app.router.add_get('/fapi/v1/depth', depth)
+    app.router.add_get('/fapi/v1/ping', ping)
+    web.run_app(app, host='127.0.0.1', port=port, print=None)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def measure(client: Client, mode: str) -> None:
+    with client.response_mode(mode):
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            await client.get_public_depth('BTCUSDT', limit=10)
+        elapsed = time.perf_counter() - started
+        results = []
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        for _ in range(REQUESTS):
+            results.append(await client.get_public_depth('BTCUSDT', limit=10))
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+    held = after.compare_to(before, 'filename')
+    blocks = sum(stat.count_diff for stat in held)
+    size = sum(stat.size_diff for stat in held)
+    print(f"{mode:<5} held {blocks / REQUESTS:6.1f} blocks {size / REQUESTS:7.0f} B  "
+          f"{elapsed / REQUESTS * 1e6:5.0f} us per request")
+
+
+async def main():
+    port = free_port()
+    server = multiprocessing.Process(target=serve, args=(port,), daemon=True)
+    server.start()
+    try:
+        # The local server has no rate limits.
+        limiter = RateLimiter(weight=TokenBucket(10 ** 9, 60))
+        async with Client(debug='error', show_limit_usage=True, limiter=limiter) as client:
+            client.host = f'http://127.0.0.1:{port}'
+            for _ in range(100):
+                try:
+                    await client.get_public_ping()
+                    break
+                except Exception:
+                    await asyncio.sleep(0.05)
+            for mode in ('full', 'data', 'raw'):
+                await measure(client, mode)
+            print(f"side channel: {client.limit_usage}")
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
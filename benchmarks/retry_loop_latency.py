@@ -0,0 +1,69 @@
+"""Event loop latency while one public endpoint is retrying.
+
+A ticker task sleeps 10 ms in a loop and records how late it wakes up.
+The lag is measured three times: on an idle loop, while a client retries
+against a dead host with RetryPolicy, and with a blocking ``time.sleep``
+like the one the old reconnect logic used.
+"""
+import asyncio
+import socket
+import time
+
+from aio_binance.futures.usdt import Client, RetryPolicy
+from aio_binance.error_handler.error import BinanceException
+
+TICK = 0.01
+
+
+async def ticker(stop: asyncio.Event) -> list[float]:
+    lags = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append((time.perf_counter() - started - TICK) * 1000)
+    return lags
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def measure(name: str, work) -> None:
+    stop = asyncio.Event()
+    task = asyncio.create_task(ticker(stop))
+    await work()
+    stop.set()
+    lags = sorted(await task)
+    print(f"{name:<24} ticks {len(lags):>4}  "
+          f"p50 {lags[len(lags) // 2]:7.2f} ms  max {lags[-1]:8.2f} ms")
+
+
+async def main():
+    client = Client(debug='error',
+                    retry=RetryPolicy(max_attempts=8, backoff=0.05, max_backoff=0.4, deadline=5))
+    client.host = f'http://127.0.0.1:{free_port()}'
+
+    async def idle():
+        await asyncio.sleep(1.5)
+
+    async def retrying():
+        try:
+            await client.get_public_time()
+        except BinanceException as err:
+            print(f"{'':<24} gave up: {err.msg[:60]}...")
+
+    async def blocking():
+        await asyncio.sleep(0.5)
+        time.sleep(0.5)
+        await asyncio.sleep(0.5)
+
+    await measure('idle loop', idle)
+    await measure('async retry', retrying)
+    await measure('blocking time.sleep', blocking)
+    await client.aclose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""Per-order overhead of signing a private request.
+
+``legacy`` repeats what the client did before: a new HMAC from
+``bytearray(secret)`` for every request, ``urlencode`` for the signature
+and a second encoding of the params by aiohttp (yarl for the URL query).
+``current`` is the client path: a cloned precomputed HMAC and one
+query string reused as the request URL.
+"""
+import hmac
+import time
+import timeit
+from hashlib import sha256
+from urllib.parse import urlencode
+
+from yarl import URL
+
+from aio_binance.futures.usdt import Client
+from aio_binance.futures.usdt.api.query import _urlencode
+
+SECRET = 'NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j'
+URL_ORDER = 'https://fapi.binance.com/fapi/v1/order'
+ORDER = {
+    'symbol': 'BTCUSDT',
+    'side': 'BUY',
+    'type': 'LIMIT',
+    'timeInForce': 'GTC',
+    'quantity': '0.002',
+    'price': '59808.02',
+    'newClientOrderId': 'grid-level-17'
+}
+NUMBER = 100_000
+
+
+def legacy() -> URL:
+    params = dict(ORDER)
+    params.update({'recvWindow': 60000, 'timestamp': int(time.time() * 1000)})
+    sign = hmac.new(
+        key=bytearray(SECRET, encoding='utf-8'),
+        msg=urlencode(params).encode('utf-8'),
+        digestmod=sha256
+    ).hexdigest()
+    params.update({'signature': str(sign)})
+    return URL(URL_ORDER).with_query({key: str(value) for key, value in params.items()})
+
+
+client = Client(key='key', secret=SECRET, debug='error')
+build_request = client._Api__build_request
+
+
+def current() -> URL:
+    return build_request('GET', 'create_private_order', '/fapi/v1/order', True, ORDER)['url']
+
+
+def main():
+    tricky = dict(ORDER, newClientOrderId='grid level/17', batchOrders='[{"price": "1"}]', reduceOnly=True)
+    assert _urlencode(tricky) == urlencode(tricky)
+    query = current().raw_query_string
+    payload, signature = query.rsplit('&signature=', 1)
+    assert signature == hmac.new(SECRET.encode(), payload.encode(), sha256).hexdigest()
+    for name, func in (('legacy', legacy), ('current', current)):
+        best = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:<8} {best / NUMBER * 1e6:6.2f} us per signed order")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""Hundreds of mixed public and private requests on one client.
+
+A local stand-in server echoes the headers, path and parameters of every
+request and drops the connection on the first attempt of some public
+requests. Every response is checked: private requests carry the API key
+and a signature, public ones carry neither, the Content-Type matches the
+method, and a retried request reaches the server again with its own
+path and parameters.
+"""
+import asyncio
+import socket
+import time
+
+import ujson
+from aiohttp import web
+
+from aio_binance.futures.usdt import Client, RateLimiter, RetryPolicy
+from aio_binance.futures.usdt.api.limiter import TokenBucket
+
+KEY = 'stress-key'
+REQUESTS = 600
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def run_server(port: int) -> web.AppRunner:
+    dropped = {}
+
+    async def echo(request: web.Request) -> web.Response:
+        params = dict(request.query)
+        if request.method != 'GET':
+            params.update(await request.post())
+        symbol = params.get('symbol', '')
+        # aiohttp silently repeats an idempotent request once on a reused
+        # connection, the second drop makes the client retry policy act.
+        if request.path == '/fapi/v1/premiumIndex' and symbol.endswith('0') and dropped.get(symbol, 0) < 2:
+            dropped[symbol] = dropped.get(symbol, 0) + 1
+            request.transport.close()
+            return web.Response()
+        return web.json_response(
+            {
+                'method': request.method,
+                'path': request.path,
+                'params': params,
+                'headers': {
+                    'api_key': request.headers.get('X-MBX-APIKEY'),
+                    'content_type': request.headers.get('Content-Type')
+                }
+            },
+            dumps=ujson.dumps,
+            headers={'X-MBX-USED-WEIGHT-1M': '1'}
+        )
+
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', echo)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', port).start()
+    return runner, dropped
+
+
+def check(kind: str, i: int, data: dict) -> None:
+    symbol = f'S{i}'
+    headers = data['headers']
+    params = data['params']
+    assert params['symbol'] == symbol, (kind, i, params)
+    if kind == 'public':
+        assert data['path'] == '/fapi/v1/premiumIndex', data
+        assert headers['api_key'] is None, data
+        assert 'signature' not in params, data
+    else:
+        assert headers['api_key'] == KEY, data
+        assert 'signature' in params, data
+    if data['method'] == 'GET':
+        assert headers['content_type'] == 'application/json', data
+    else:
+        assert headers['content_type'] == 'application/x-www-form-urlencoded', data
+
+
+async def main():
+    port = free_port()
+    runner, dropped = await run_server(port)
+    async with Client(key=KEY, secret='stress-secret', debug='error',
+                      retry=RetryPolicy(backoff=0.01, max_backoff=0.1),
+                      limiter=RateLimiter(weight=TokenBucket(10 ** 6, 60))) as client:
+        client.host = f'http://127.0.0.1:{port}'
+        calls = []
+        for i in range(REQUESTS):
+            symbol = f'S{i}'
+            match i % 3:
+                case 0:
+                    calls.append(('public', i, client.get_public_mark_price(symbol=symbol)))
+                case 1:
+                    calls.append(('private', i, client.get_private_open_order(symbol, i)))
+                case 2:
+                    calls.append(('private', i, client.create_private_order(
+                        symbol, 'BUY', 'LIMIT', quantity=1, price=i, time_in_force='GTC')))
+        started = time.perf_counter()
+        results = await asyncio.gather(*[call for _, _, call in calls])
+        elapsed = time.perf_counter() - started
+        for (kind, i, _), res in zip(calls, results):
+            check(kind, i, res['data'])
+        print(f"{REQUESTS} concurrent requests checked in {elapsed:0.2f} sec., "
+              f"{len(dropped)} requests retried after dropped connections. "
+              f"Pool: {client.pool_stats}")
+    await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
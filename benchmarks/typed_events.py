@@ -0,0 +1,106 @@
+"""Decoding cost and memory of market stream events, dicts versus typed events.
+
+``dict`` is the message as the codec returns it, ``typed`` is the same
+message through ``decode_event``. ``read`` adds what a consumer does with
+every message: the numbers of a dict are converted with ``float()`` when
+read, those of a typed event are already floats. Memory is measured with
+tracemalloc on 100k buffered events and given per 1M events.
+"""
+import random
+import timeit
+import tracemalloc
+
+import ujson
+
+from aio_binance.futures.usdt.websocket.events import decode_event
+
+NUMBER = 100_000
+BUFFERED = 100_000
+
+
+def agg_trade(i: int) -> dict:
+    price = random.uniform(30000, 60000)
+    return {'e': 'aggTrade', 'E': 1640995200000 + i, 's': 'BTCUSDT', 'a': 5933014 + i, 'p': f'{price:.2f}',
+            'q': f'{random.uniform(0, 5):.3f}', 'f': 100 + i, 'l': 105 + i, 'T': 1640995200000 + i, 'm': True}
+
+
+def kline(i: int) -> dict:
+    price = random.uniform(30000, 60000)
+    return {'e': 'kline', 'E': 1640995200000 + i, 's': 'BTCUSDT', 'k': {
+        't': 1640995200000, 'T': 1640995259999, 's': 'BTCUSDT', 'i': '1m', 'f': 100, 'L': 200,
+        'o': f'{price:.2f}', 'c': f'{price * 1.001:.2f}', 'h': f'{price * 1.002:.2f}', 'l': f'{price * 0.999:.2f}',
+        'v': f'{random.uniform(0, 500):.3f}', 'n': 100, 'x': False, 'q': f'{random.uniform(0, 1e7):.5f}',
+        'V': f'{random.uniform(0, 250):.3f}', 'Q': f'{random.uniform(0, 5e6):.5f}', 'B': '0'}}
+
+
+def book_ticker(i: int) -> dict:
+    price = random.uniform(30000, 60000)
+    return {'e': 'bookTicker', 'u': 400900217 + i, 'E': 1640995200000 + i, 'T': 1640995200000 + i,
+            's': 'BTCUSDT', 'b': f'{price:.2f}', 'B': f'{random.uniform(0, 50):.3f}',
+            'a': f'{price + 0.1:.2f}', 'A': f'{random.uniform(0, 50):.3f}'}
+
+
+def mark_price(i: int) -> dict:
+    price = random.uniform(30000, 60000)
+    return {'e': 'markPriceUpdate', 'E': 1640995200000 + i, 's': 'BTCUSDT', 'p': f'{price:.8f}',
+            'i': f'{price:.8f}', 'P': f'{price:.8f}', 'r': '0.00038167', 'T': 1641024000000}
+
+
+def liquidation(i: int) -> dict:
+    price = random.uniform(30000, 60000)
+    return {'e': 'forceOrder', 'E': 1640995200000 + i, 'o': {
+        's': 'BTCUSDT', 'S': 'SELL', 'o': 'LIMIT', 'f': 'IOC', 'q': '0.014', 'p': f'{price:.2f}',
+        'ap': f'{price:.2f}', 'X': 'FILLED', 'l': '0.014', 'z': '0.014', 'T': 1640995200000 + i}}
+
+
+def depth(i: int) -> dict:
+    price = random.uniform(30000, 60000)
+    return {'e': 'depthUpdate', 'E': 1640995200000 + i, 'T': 1640995200000 + i, 's': 'BTCUSDT',
+            'U': 157 + i, 'u': 160 + i, 'pu': 149 + i,
+            'b': [[f'{price - k * 0.1:.1f}', f'{random.uniform(0, 5):.3f}'] for k in range(10)],
+            'a': [[f'{price + k * 0.1:.1f}', f'{random.uniform(0, 5):.3f}'] for k in range(10)]}
+
+
+READ = {
+    'aggTrade': (lambda m: float(m['p']) * float(m['q']), lambda e: e.price * e.quantity),
+    'kline': (lambda m: float(m['k']['c']) - float(m['k']['o']), lambda e: e.close - e.open),
+    'bookTicker': (lambda m: float(m['a']) - float(m['b']), lambda e: e.ask_price - e.bid_price),
+    'markPriceUpdate': (lambda m: float(m['p']) - float(m['i']), lambda e: e.mark_price - e.index_price),
+    'forceOrder': (lambda m: float(m['o']['ap']) * float(m['o']['z']), lambda e: e.average_price * e.filled),
+    'depthUpdate': (lambda m: float(m['a'][0][0]) - float(m['b'][0][0]), lambda e: e.asks[0][0] - e.bids[0][0]),
+}
+
+
+def per_message(func, raws: list[str]) -> float:
+    it = iter(raws * (NUMBER // len(raws) + 1))
+    best = min(timeit.repeat(lambda: func(next(it)), number=NUMBER // 10, repeat=5))
+    return best / (NUMBER // 10) * 1e6
+
+
+def memory(build, raws: list[str]) -> float:
+    tracemalloc.start()
+    buffered = [build(raw) for raw in raws]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del buffered
+    return size / len(raws) * 1_000_000 / 2 ** 20
+
+
+def main():
+    random.seed(1)
+    print(f"{'event':<16}{'dict us':>9}{'typed us':>10}{'dict+read':>11}{'typed+read':>12}"
+          f"{'dict MiB/1M':>13}{'typed MiB/1M':>14}")
+    for make in (agg_trade, kline, book_ticker, mark_price, liquidation, depth):
+        raws = [ujson.dumps(make(i)) for i in range(BUFFERED)]
+        read_dict, read_typed = READ[make(0)['e']]
+        print(f"{make(0)['e']:<16}"
+              f"{per_message(ujson.loads, raws):>9.2f}"
+              f"{per_message(lambda raw: decode_event(ujson.loads(raw)), raws):>10.2f}"
+              f"{per_message(lambda raw: read_dict(ujson.loads(raw)), raws):>11.2f}"
+              f"{per_message(lambda raw: read_typed(decode_event(ujson.loads(raw))), raws):>12.2f}"
+              f"{memory(ujson.loads, raws):>13.0f}"
+              f"{memory(lambda raw: decode_event(ujson.loads(raw)), raws):>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
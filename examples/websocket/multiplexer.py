@@ -0,0 +1,29 @@
+import asyncio
+
+from aio_binance.futures.usdt import WsClient
+
+SYMBOLS = ['BTCUSDT', 'ETHUSDT', 'BNBUSDT']
+
+
+async def callback_event(data: dict):
+    """
+    Args:
+        data (dict): Combined stream events are wrapped as follows: {"stream":"<streamName>","data":<rawPayload>}
+    """
+    print(data)
+
+
+async def main():
+    """
+    One connection carries up to 200 streams, streams are added and removed without reconnecting.
+    """
+    ws = WsClient()
+    async with ws.multiplex(callback_event) as mux:
+        await mux.subscribe([await ws.stream_agg_trade(symbol) for symbol in SYMBOLS])
+        await asyncio.sleep(10)
+        await mux.subscribe([await ws.stream_mark_price(symbol) for symbol in SYMBOLS])
+        await mux.unsubscribe([await ws.stream_agg_trade(symbol) for symbol in SYMBOLS])
+        print(await mux.list_subscriptions())
+        await asyncio.sleep(10)
+
+asyncio.run(main())
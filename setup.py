@@ -39,6 +39,7 @@ setup(
     url=URL,
     keywords=["Binance", "Public API"],
     install_requires=[req for req in requirements],
+    extras_require={"numpy": ["numpy>=1.21"], "orjson": ["orjson>=3.6"]},
     packages=find_packages(exclude=("tests",)),
     classifiers=[
         "Intended Audience :: Developers",